@@ -643,23 +643,33 @@ def get_metadata_ttl(meta_data):
         return 86400 * 30
 
 
-def get_meta(content_type, meta_id):
+def _normalize_meta_type(content_type):
+    """Map a listing content type onto the type metadata is requested and cached under."""
+    # API Compatibility mapping
+    if content_type in ['tvshow', 'tvshows', 'episode']:
+        return 'series'
+
+    # Internal suppression for 'home' type
+    if content_type == 'home':
+        # Default to movie or handle based on path? Usually smart_widget should pass correct type.
+        # Fallback to movie for safety
+        return 'movie'
+    return content_type
+
+
+def get_meta(content_type, meta_id, sql_writes=None):
     """Fetch metadata for a show or movie with optimized TTL caching.
 
     Cache TTL varies based on content age:
     - Current year: 7 days (metadata may be updated)
     - Last year: 30 days
     - Older: 90 days (metadata is stable)
+
+    sql_writes: Optional list; when given, the SQL cache write for a fresh
+    result is appended to it for the caller to store with set_metas_bulk
+    instead of being committed here.
     """
-    # API Compatibility mapping
-    if content_type in ['tvshow', 'tvshows', 'episode']:
-        content_type = 'series'
-    
-    # Internal suppression for 'home' type
-    if content_type == 'home':
-        # Default to movie or handle based on path? Usually smart_widget should pass correct type.
-        # Fallback to movie for safety
-        content_type = 'movie'
+    content_type = _normalize_meta_type(content_type)
     from resources.lib import trakt
     # 1. Check SQL cache first (fastest)
     if HAS_MODULES:
@@ -722,12 +732,15 @@ def get_meta(content_type, meta_id):
         # 1. File cache
         cache.cache_meta(content_type, meta_id, result)
         # 2. SQL cache
-        try:
-            db = trakt.get_trakt_db()
-            if db:
-                db.set_meta(content_type, meta_id, result, ttl)
-        except:
-            pass
+        if sql_writes is not None:
+            sql_writes.append((content_type, meta_id, result, ttl))
+        else:
+            try:
+                db = trakt.get_trakt_db()
+                if db:
+                    db.set_meta(content_type, meta_id, result, ttl)
+            except:
+                pass
         xbmc.log(f'[AIOStreams] Cached metadata for {meta_id} (TTL: {ttl//86400} days)', xbmc.LOGDEBUG)
         
         # 3. Cache clearlogo if present
@@ -785,6 +798,33 @@ def fetch_metadata_parallel(items, content_type='movie'):
         return {}
         
     results = {}
+
+    # get_meta checks the SQL cache first, so serve those hits here and only fan out
+    # the misses, loading their file-cache entries in one query beforehand
+    if HAS_MODULES:
+        from resources.lib import trakt
+        meta_type = _normalize_meta_type(content_type)
+        misses = []
+        meta_ids = []
+        db = trakt.get_trakt_db()
+        with trakt.row_cache_batch():
+            for item in items:
+                ids = item.get('ids', {})
+                item_id = ids.get('imdb') or ids.get('tmdb') or item.get('imdb_id')
+                cached_sql = db.get_meta(meta_type, item_id) if db and item_id else None
+                if cached_sql:
+                    _ensure_clearlogo_cached(cached_sql, meta_type, item_id)
+                    if 'meta' in cached_sql:
+                        results[item_id] = cached_sql['meta']
+                    continue
+                misses.append(item)
+                if item_id:
+                    meta_ids.append(f"{meta_type}:{item_id}")
+        items = misses
+        cache.get_cache().prefetch('metadata', meta_ids, ttl_seconds=86400*365)
+
+    # SQL cache writes from the workers, committed together once they finish
+    sql_writes = []
     
     def fetch_single(item):
         try:
@@ -799,7 +839,7 @@ def fetch_metadata_parallel(items, content_type='movie'):
             
             # Create a localized DB connection/check if necessary or rely on safe get_meta
             # get_meta handles its own DB connections safely
-            meta_result = get_meta(content_type, item_id)
+            meta_result = get_meta(content_type, item_id, sql_writes)
             
             if meta_result and 'meta' in meta_result:
                 return (item_id, meta_result['meta'])
@@ -807,6 +847,11 @@ def fetch_metadata_parallel(items, content_type='movie'):
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error in fetch_single: {e}', xbmc.LOGERROR)
             return None
+        finally:
+            # Pool threads must not keep the connection get_meta opened on them
+            if HAS_MODULES:
+                from resources.lib import trakt
+                trakt.close_trakt_db()
 
     # Use thread pool for parallel fetching
     with ThreadPoolExecutor(max_workers=20) as executor:
@@ -819,12 +864,25 @@ def fetch_metadata_parallel(items, content_type='movie'):
                     results[result[0]] = result[1]
             except:
                 pass
+
+    if sql_writes:
+        try:
+            from resources.lib import trakt
+            db = trakt.get_trakt_db()
+            if db:
+                db.set_metas_bulk(sql_writes)
+        except Exception as e:
+            xbmc.log(f'[AIOStreams] Error storing fetched metadata: {e}', xbmc.LOGERROR)
                 
     return results
 
 
-def create_listitem_with_context(meta, content_type, action_url):
-    """Create ListItem with full metadata, artwork, and context menus."""
+def create_listitem_with_context(meta, content_type, action_url, watched=None):
+    """Create ListItem with full metadata, artwork, and context menus.
+
+    watched: Optional pre-fetched Trakt watched status (see are_imdb_watched);
+    looked up in the local DB when None.
+    """
     from resources.lib import trakt
     title = meta.get('name') or meta.get('title') or 'Unknown Title'
     list_item = xbmcgui.ListItem(label=title)
@@ -1092,7 +1150,7 @@ def create_listitem_with_context(meta, content_type, action_url):
                 db = trakt.get_trakt_db()
                 if db:
                     # Check watched status using local DB directly with IMDb ID
-                    is_watched = db.is_imdb_watched(item_id, content_type)
+                    is_watched = watched if watched is not None else db.is_imdb_watched(item_id, content_type)
                     if is_watched:
                         info_tag.setPlaycount(1)
                         list_item.setProperty('WatchedOverlay', 'indicator_watched.png')
@@ -1190,8 +1248,8 @@ def create_listitem_with_context(meta, content_type, action_url):
             db = trakt.get_trakt_db()
             
             # OPTIMIZATION: Use local DB for Watched status
-            is_watched = False
-            if db:
+            is_watched = bool(watched)
+            if db and watched is None:
                 is_watched = db.is_imdb_watched(item_id, content_type)
 
             if is_watched:
@@ -1354,6 +1412,7 @@ def cancel_all_background_tasks(active=True):
 
 def action_search(params=None):
     """Unified search action for both plugin menus and external calls."""
+    from resources.lib import trakt
     if params is None:
         params = dict(parse_qsl(sys.argv[2][1:]))
     
@@ -1425,52 +1484,53 @@ def action_search(params=None):
         items = filters.filter_items(items)
 
     # Display results
-    for meta in items:
-        item_id = meta.get('id')
-        item_type = meta.get('type', content_type)
+    with trakt.row_cache_batch():
+        for meta in items:
+            item_id = meta.get('id')
+            item_type = meta.get('type', content_type)
 
-        if item_type == 'series':
-            url = get_url(action='show_seasons', meta_id=item_id)
-            is_folder = True
-        elif content_type in ['video', 'youtube'] or 'youtube' in str(item_type):
-            # YouTube specific logic
-            item_url = meta.get('url', '')
-            item_name = meta.get('name', '')
+            if item_type == 'series':
+                url = get_url(action='show_seasons', meta_id=item_id)
+                is_folder = True
+            elif content_type in ['video', 'youtube'] or 'youtube' in str(item_type):
+                # YouTube specific logic
+                item_url = meta.get('url', '')
+                item_name = meta.get('name', '')
             
-            is_youtube_folder = (
-                '/channel/' in item_url or
-                '/playlist/' in item_url or
-                'Channels' in item_name or
-                'Playlists' in item_name or
-                meta.get('mediatype') in ['channel', 'playlist']
-            )
+                is_youtube_folder = (
+                    '/channel/' in item_url or
+                    '/playlist/' in item_url or
+                    'Channels' in item_name or
+                    'Playlists' in item_name or
+                    meta.get('mediatype') in ['channel', 'playlist']
+                )
             
-            if is_youtube_folder:
-                if not xbmc.getCondVisibility('System.HasAddon(plugin.video.youtube)'):
-                    continue
-                item_url = item_url if item_url else meta.get('id', '')
-                url = get_url(action='open_youtube_folder', url=item_url)
-                is_folder = False
+                if is_youtube_folder:
+                    if not xbmc.getCondVisibility('System.HasAddon(plugin.video.youtube)'):
+                        continue
+                    item_url = item_url if item_url else meta.get('id', '')
+                    url = get_url(action='open_youtube_folder', url=item_url)
+                    is_folder = False
+                else:
+                    title = meta.get('name') or meta.get('title') or 'Unknown Title'
+                    poster = meta.get('poster', '')
+                    fanart = meta.get('background', '')
+                    clearlogo = meta.get('logo', '')
+                    url = get_url(action='play', content_type='video', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
+                    is_folder = False
             else:
                 title = meta.get('name') or meta.get('title') or 'Unknown Title'
                 poster = meta.get('poster', '')
                 fanart = meta.get('background', '')
                 clearlogo = meta.get('logo', '')
-                url = get_url(action='play', content_type='video', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
+                url = get_url(action='play', content_type='movie' if item_type == 'movie' else item_type, imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
                 is_folder = False
-        else:
-            title = meta.get('name') or meta.get('title') or 'Unknown Title'
-            poster = meta.get('poster', '')
-            fanart = meta.get('background', '')
-            clearlogo = meta.get('logo', '')
-            url = get_url(action='play', content_type='movie' if item_type == 'movie' else item_type, imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
-            is_folder = False
-
-        list_item = create_listitem_with_context(meta, item_type, url)
-        if not is_folder:
-            list_item.setProperty('IsPlayable', 'true')
 
-        xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
+            list_item = create_listitem_with_context(meta, item_type, url)
+            if not is_folder:
+                list_item.setProperty('IsPlayable', 'true')
+
+            xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
     
     # Load more if available (heuristic check)
     if len(results['metas']) >= 20:
@@ -1535,6 +1595,7 @@ def add_tab_switcher(query, current_tab):
 
 def search_all_results(query):
     """Show all results (movies and TV shows) in one view with category headers."""
+    from resources.lib import trakt
     xbmcplugin.setPluginCategory(HANDLE, f'Search: {query}')
     xbmcplugin.setContent(HANDLE, 'videos')
 
@@ -1560,16 +1621,17 @@ def search_all_results(query):
 
         if movies:
             # Movies section header removed
-            for meta in movies[:10]:
-                item_id = meta.get('id')
-                title = meta.get('name', 'Unknown')
-                poster = meta.get('poster', '')
-                fanart = meta.get('background', '')
-                clearlogo = meta.get('logo', '')
-                url = get_url(action='play', content_type='movie', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
-                list_item = create_listitem_with_context(meta, 'movie', url)
-                list_item.setProperty('IsPlayable', 'true')
-                xbmcplugin.addDirectoryItem(HANDLE, url, list_item, False)
+            with trakt.row_cache_batch():
+                for meta in movies[:10]:
+                    item_id = meta.get('id')
+                    title = meta.get('name', 'Unknown')
+                    poster = meta.get('poster', '')
+                    fanart = meta.get('background', '')
+                    clearlogo = meta.get('logo', '')
+                    url = get_url(action='play', content_type='movie', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
+                    list_item = create_listitem_with_context(meta, 'movie', url)
+                    list_item.setProperty('IsPlayable', 'true')
+                    xbmcplugin.addDirectoryItem(HANDLE, url, list_item, False)
 
             if len(movies) > 10:
                 list_item = xbmcgui.ListItem(label=f'[COLOR yellow]   » View All Movies ({len(movies)} results)[/COLOR]')
@@ -1584,11 +1646,12 @@ def search_all_results(query):
 
         if shows:
             # TV Shows section header removed
-            for meta in shows[:10]:
-                item_id = meta.get('id')
-                url = get_url(action='show_seasons', meta_id=item_id)
-                list_item = create_listitem_with_context(meta, 'series', url)
-                xbmcplugin.addDirectoryItem(HANDLE, url, list_item, True)
+            with trakt.row_cache_batch():
+                for meta in shows[:10]:
+                    item_id = meta.get('id')
+                    url = get_url(action='show_seasons', meta_id=item_id)
+                    list_item = create_listitem_with_context(meta, 'series', url)
+                    xbmcplugin.addDirectoryItem(HANDLE, url, list_item, True)
 
             if len(shows) > 10:
                 list_item = xbmcgui.ListItem(label=f'[COLOR yellow]   » View All TV Shows ({len(shows)} results)[/COLOR]')
@@ -2407,31 +2470,42 @@ def browse_catalog():
     # DEBUG LOGGING for User
     if catalog_data.get('metas') and len(catalog_data['metas']) > 0:
         first_item = catalog_data['metas'][0]
+
+    # Watched status for the whole page in a few IN (...) queries instead of one lookup per item
+    watched_map = {}
+    if HAS_MODULES and trakt.get_access_token():
+        try:
+            db = trakt.get_trakt_db()
+            if db:
+                watched_map = db.are_imdb_watched((meta.get('id') for meta in catalog_data['metas']), content_type)
+        except Exception as e:
+            xbmc.log(f'[AIOStreams] browse_catalog: Failed to prefetch watched status: {e}', xbmc.LOGERROR)
     
     # Display catalog items
-    for meta in catalog_data['metas']:
-        item_id = meta.get('id')
-        item_type = meta.get('type', content_type)
+    with trakt.row_cache_batch():
+        for meta in catalog_data['metas']:
+            item_id = meta.get('id')
+            item_type = meta.get('type', content_type)
         
-        # Determine if this is a series or movie
-        if item_type == 'series':
-            url = get_url(action='show_seasons', meta_id=item_id)
-            is_folder = True
-        else:
-            title = meta.get('name', 'Unknown')
-            poster = meta.get('poster', '')
-            fanart = meta.get('background', '')
-            clearlogo = meta.get('logo', '')
-            url = get_url(action='play', content_type='movie', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
-            is_folder = False
+            # Determine if this is a series or movie
+            if item_type == 'series':
+                url = get_url(action='show_seasons', meta_id=item_id)
+                is_folder = True
+            else:
+                title = meta.get('name', 'Unknown')
+                poster = meta.get('poster', '')
+                fanart = meta.get('background', '')
+                clearlogo = meta.get('logo', '')
+                url = get_url(action='play', content_type='movie', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
+                is_folder = False
 
-        list_item = create_listitem_with_context(meta, content_type, url)
+            list_item = create_listitem_with_context(meta, content_type, url, watched_map.get(item_id))
 
-        # Set IsPlayable property for movies
-        if not is_folder:
-            list_item.setProperty('IsPlayable', 'true')
+            # Set IsPlayable property for movies
+            if not is_folder:
+                list_item.setProperty('IsPlayable', 'true')
 
-        xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
+            xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
     
     # Check if next page exists by checking metas count
     # If we got a full page (20 items), assume there might be more
@@ -3409,72 +3483,73 @@ def trakt_watchlist(params=None):
     content_type_fetch = 'movie' if media_type == 'movies' else 'series'
     metadata_map = fetch_metadata_parallel(items_to_fetch, content_type=content_type_fetch)
 
-    for item in items:
-        item_data = item.get('movie' if media_type == 'movies' else 'show', {})
-        item_id = item_data.get('ids', {}).get('imdb', '')
+    with trakt.row_cache_batch():
+        for item in items:
+            item_data = item.get('movie' if media_type == 'movies' else 'show', {})
+            item_id = item_data.get('ids', {}).get('imdb', '')
 
-        if not item_id:
-            continue
+            if not item_id:
+                continue
 
-        content_type = 'movie' if media_type == 'movies' else 'series'
-
-        # Build metadata from Trakt data (no API call needed for text fields)
-        meta = {
-            'id': item_id,
-            'name': item_data.get('title', 'Unknown'),
-            'description': item_data.get('overview', ''),
-            'year': item_data.get('year', 0),
-            'genres': item_data.get('genres', []),
-            'imdbRating': str(item_data.get('rating', '')) if item_data.get('rating') else '',
-            'rating': item_data.get('rating', ''),
-            'trakt_rating': item_data.get('rating', '')
-        }
+            content_type = 'movie' if media_type == 'movies' else 'series'
 
-        # Use fetched metadata (parallel results)
-        if item_id in metadata_map:
-            cached_data = metadata_map[item_id]
+            # Build metadata from Trakt data (no API call needed for text fields)
+            meta = {
+                'id': item_id,
+                'name': item_data.get('title', 'Unknown'),
+                'description': item_data.get('overview', ''),
+                'year': item_data.get('year', 0),
+                'genres': item_data.get('genres', []),
+                'imdbRating': str(item_data.get('rating', '')) if item_data.get('rating') else '',
+                'rating': item_data.get('rating', ''),
+                'trakt_rating': item_data.get('rating', '')
+            }
+
+            # Use fetched metadata (parallel results)
+            if item_id in metadata_map:
+                cached_data = metadata_map[item_id]
             
-            # Enhance with cached artwork and other metadata
-            meta['poster'] = cached_data.get('poster', '')
-            meta['background'] = cached_data.get('background', '')
-            meta['logo'] = cached_data.get('logo', '')
+                # Enhance with cached artwork and other metadata
+                meta['poster'] = cached_data.get('poster', '')
+                meta['background'] = cached_data.get('background', '')
+                meta['logo'] = cached_data.get('logo', '')
             
-            # CRITICAL FIX: If Trakt title is missing or "Unknown", use AIOStreams Title
-            cached_title = cached_data.get('title') or cached_data.get('name', '')
-            if (not meta.get('name') or meta['name'] == 'Unknown') and cached_title:
-                meta['name'] = cached_title
+                # CRITICAL FIX: If Trakt title is missing or "Unknown", use AIOStreams Title
+                cached_title = cached_data.get('title') or cached_data.get('name', '')
+                if (not meta.get('name') or meta['name'] == 'Unknown') and cached_title:
+                    meta['name'] = cached_title
             
-            # Use cached description if Trakt description is empty
-            if not meta.get('description') and cached_data.get('description'):
-                meta['description'] = cached_data['description']
+                # Use cached description if Trakt description is empty
+                if not meta.get('description') and cached_data.get('description'):
+                    meta['description'] = cached_data['description']
                 
-            # Get cast from cached AIOStreams data (includes photos)
-            if 'cast' in cached_data:
-                meta['cast'] = cached_data['cast']
+                # Get cast from cached AIOStreams data (includes photos)
+                if 'cast' in cached_data:
+                    meta['cast'] = cached_data['cast']
                 
-            # MERGE CHIP METADATA: genres, rating, mpaa
-            if cached_data.get('genres'):
-                meta['genres'] = cached_data['genres']
-            if cached_data.get('rating'):
-                meta['imdbRating'] = str(cached_data['rating'])
-            if cached_data.get('mpaa') or cached_data.get('certification'):
-                meta['mpaa'] = cached_data.get('mpaa') or cached_data.get('certification')
-            if cached_data.get('runtime'):
-                meta['runtime'] = str(cached_data['runtime'])
-            if cached_data.get('released'):
-                meta['released'] = cached_data['released']
-
-        # Set URL and folder status based on content type
-        if content_type == 'series':
-            url = get_url(action='show_seasons', meta_id=item_id)
-            is_folder = True
-        else:
-            url = get_url(action='play', content_type='movie', imdb_id=item_id, title=meta.get('name', ''), 
-                         poster=meta.get('poster', ''), fanart=meta.get('background', ''), clearlogo=meta.get('logo', ''))
-            is_folder = False
+                # MERGE CHIP METADATA: genres, rating, mpaa
+                if cached_data.get('genres'):
+                    meta['genres'] = cached_data['genres']
+                if cached_data.get('rating'):
+                    meta['imdbRating'] = str(cached_data['rating'])
+                if cached_data.get('mpaa') or cached_data.get('certification'):
+                    meta['mpaa'] = cached_data.get('mpaa') or cached_data.get('certification')
+                if cached_data.get('runtime'):
+                    meta['runtime'] = str(cached_data['runtime'])
+                if cached_data.get('released'):
+                    meta['released'] = cached_data['released']
+
+            # Set URL and folder status based on content type
+            if content_type == 'series':
+                url = get_url(action='show_seasons', meta_id=item_id)
+                is_folder = True
+            else:
+                url = get_url(action='play', content_type='movie', imdb_id=item_id, title=meta.get('name', ''), 
+                             poster=meta.get('poster', ''), fanart=meta.get('background', ''), clearlogo=meta.get('logo', ''))
+                is_folder = False
 
-        list_item = create_listitem_with_context(meta, content_type, url)
-        xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
+            list_item = create_listitem_with_context(meta, content_type, url)
+            xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
 
     # Set NumItems property if called from smart_widget
     if params.get('page') and params.get('index'):
@@ -3723,10 +3798,11 @@ def trakt_next_up():
             return None
 
     # Execute processing
-    for ep in next_episodes:
-        result = process_ep(ep)
-        if result:
-            xbmcplugin.addDirectoryItem(HANDLE, result[0], result[1], result[2])
+    with trakt.row_cache_batch():
+        for ep in next_episodes:
+            result = process_ep(ep)
+            if result:
+                xbmcplugin.addDirectoryItem(HANDLE, result[0], result[1], result[2])
 
     # Push Next Up data to window properties for instant widget updates
     _push_next_up_to_window(next_episodes)
@@ -3789,54 +3865,55 @@ def show_related():
         metadata_map.update(fetch_metadata_parallel(show_items, 'series'))
 
     # Display related items
-    for item in items:
-        item_type = 'movie' if 'movie' in item else 'show'
-        item_data = item.get('movie') or item.get('show', {})
-        item_id = item_data.get('ids', {}).get('imdb', '')
+    with trakt.row_cache_batch():
+        for item in items:
+            item_type = 'movie' if 'movie' in item else 'show'
+            item_data = item.get('movie') or item.get('show', {})
+            item_id = item_data.get('ids', {}).get('imdb', '')
 
-        if not item_id:
-            continue
-
-        # Use the correct content type for this specific item
-        item_content_type = 'movie' if item_type == 'movie' else 'series'
-
-        # Use parallel result if available
-        meta = None
-        if item_id in metadata_map:
-            meta = metadata_map[item_id]
-        else:
-            # Fallback (should typically be covered by parallel fetch)
-            meta_data = get_meta(item_content_type, item_id)
-            if meta_data and 'meta' in meta_data:
-                meta = meta_data['meta']
+            if not item_id:
+                continue
 
-        if not meta:
-            meta = {
-                'id': item_id,
-                'name': item_data.get('title', 'Unknown'),
-                'description': item_data.get('overview', ''),
-                'year': item_data.get('year', 0),
-                'genres': []
-            }
+            # Use the correct content type for this specific item
+            item_content_type = 'movie' if item_type == 'movie' else 'series'
 
-        if item_content_type == 'series':
-            url = get_url(action='show_seasons', meta_id=item_id)
-            is_folder = True
-        else:
-            title = meta.get('name', 'Unknown')
-            poster = meta.get('poster', '')
-            fanart = meta.get('background', '')
-            clearlogo = meta.get('logo', '')
-            url = get_url(action='play', content_type='movie', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
-            is_folder = False
+            # Use parallel result if available
+            meta = None
+            if item_id in metadata_map:
+                meta = metadata_map[item_id]
+            else:
+                # Fallback (should typically be covered by parallel fetch)
+                meta_data = get_meta(item_content_type, item_id)
+                if meta_data and 'meta' in meta_data:
+                    meta = meta_data['meta']
+
+            if not meta:
+                meta = {
+                    'id': item_id,
+                    'name': item_data.get('title', 'Unknown'),
+                    'description': item_data.get('overview', ''),
+                    'year': item_data.get('year', 0),
+                    'genres': []
+                }
+
+            if item_content_type == 'series':
+                url = get_url(action='show_seasons', meta_id=item_id)
+                is_folder = True
+            else:
+                title = meta.get('name', 'Unknown')
+                poster = meta.get('poster', '')
+                fanart = meta.get('background', '')
+                clearlogo = meta.get('logo', '')
+                url = get_url(action='play', content_type='movie', imdb_id=item_id, title=title, poster=poster, fanart=fanart, clearlogo=clearlogo)
+                is_folder = False
 
-        list_item = create_listitem_with_context(meta, item_content_type, url)
+            list_item = create_listitem_with_context(meta, item_content_type, url)
 
-        # Set IsPlayable property for movies
-        if not is_folder:
-            list_item.setProperty('IsPlayable', 'true')
+            # Set IsPlayable property for movies
+            if not is_folder:
+                list_item.setProperty('IsPlayable', 'true')
 
-        xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
+            xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
 
     xbmcplugin.endOfDirectory(HANDLE)
 
@@ -4145,18 +4222,12 @@ def clear_cache():
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error clearing stream data: {e}', xbmc.LOGWARNING)
 
-        # Verify manifest cache was cleared by checking for manifest files
-        cache_dir = cache.get_cache_dir()
-        remaining_manifests = []
+        # Verify manifest cache was cleared by checking for stored manifest entries
         try:
-            import os
-            dirs, files = xbmcvfs.listdir(cache_dir)
-            for filename in files:
-                if filename.startswith('manifest_') and filename.endswith('.json'):
-                    remaining_manifests.append(filename)
-            
+            remaining_manifests = cache.get_cache().get_stats()['disk']['types'].get('manifest', 0)
+
             if remaining_manifests:
-                xbmc.log(f'[AIOStreams] Warning: {len(remaining_manifests)} manifest files still present after cleanup', xbmc.LOGWARNING)
+                xbmc.log(f'[AIOStreams] Warning: {remaining_manifests} manifest entries still present after cleanup', xbmc.LOGWARNING)
             else:
                 xbmc.log('[AIOStreams] Manifest cache successfully cleared', xbmc.LOGINFO)
         except Exception as e:
@@ -4939,52 +5010,53 @@ def smart_widget():
                         res = future.result()
                         if res: metadata_map[res[0]] = res[1]
 
-            for meta in catalog_data['metas']:
-                try:
-                    item_id = meta.get('id')
-                    if not item_id:
-                        continue
+            with trakt.row_cache_batch():
+                for meta in catalog_data['metas']:
+                    try:
+                        item_id = meta.get('id')
+                        if not item_id:
+                            continue
                     
-                    # Merge with full metadata if available (for logos, cast, etc.)
-                    full_meta = metadata_map.get(item_id, {})
-                    if full_meta:
-                        # Smart merge: full_meta overwrites catalog data, but preserve non-empty rating fields
-                        merged_meta = {**meta, **full_meta}
-
-                        # Preserve catalog values if API result is missing them (or empty)
-                        for field in ['imdbRating', 'rating', 'Rating', 'stremio_rating', 'trakt_rating']:
-                            val = meta.get(field)
-                            if not merged_meta.get(field) and val:
-                                # Filter likely dummy values from catalogs (like 7 or 0)
-                                try:
-                                    f_val = float(val)
-                                    if f_val == 0: continue
-                                    # If it's a new item (likely from Cinemate), ignore the '7' placeholder
-                                    if f_val == 7.0 and not meta.get('released'): continue
-                                except: pass
+                        # Merge with full metadata if available (for logos, cast, etc.)
+                        full_meta = metadata_map.get(item_id, {})
+                        if full_meta:
+                            # Smart merge: full_meta overwrites catalog data, but preserve non-empty rating fields
+                            merged_meta = {**meta, **full_meta}
+
+                            # Preserve catalog values if API result is missing them (or empty)
+                            for field in ['imdbRating', 'rating', 'Rating', 'stremio_rating', 'trakt_rating']:
+                                val = meta.get(field)
+                                if not merged_meta.get(field) and val:
+                                    # Filter likely dummy values from catalogs (like 7 or 0)
+                                    try:
+                                        f_val = float(val)
+                                        if f_val == 0: continue
+                                        # If it's a new item (likely from Cinemate), ignore the '7' placeholder
+                                        if f_val == 7.0 and not meta.get('released'): continue
+                                    except: pass
                                 
-                                merged_meta[field] = val
-                                xbmc.log(f'[AIOStreams] Preserved catalog {field}={val} for {item_id}', xbmc.LOGDEBUG)
-                    else:
-                        merged_meta = meta
+                                    merged_meta[field] = val
+                                    xbmc.log(f'[AIOStreams] Preserved catalog {field}={val} for {item_id}', xbmc.LOGDEBUG)
+                        else:
+                            merged_meta = meta
                     
-                    if content_type == 'series':
-                        url = get_url(action='show_seasons', meta_id=item_id)
-                        is_folder = True
-                    else:
-                        url = get_url(action='show_streams', content_type='movie', media_id=item_id,
-                                    title=merged_meta.get('name', ''), poster=merged_meta.get('poster', ''),
-                                    fanart=merged_meta.get('background', ''), clearlogo=merged_meta.get('logo', ''))
-                        is_folder = False
+                        if content_type == 'series':
+                            url = get_url(action='show_seasons', meta_id=item_id)
+                            is_folder = True
+                        else:
+                            url = get_url(action='show_streams', content_type='movie', media_id=item_id,
+                                        title=merged_meta.get('name', ''), poster=merged_meta.get('poster', ''),
+                                        fanart=merged_meta.get('background', ''), clearlogo=merged_meta.get('logo', ''))
+                            is_folder = False
                     
-                    list_item = create_listitem_with_context(merged_meta, content_type, url)
-                    xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
+                        list_item = create_listitem_with_context(merged_meta, content_type, url)
+                        xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
 
 
-                except Exception as e:
-                    import traceback
-                    xbmc.log(f'[AIOStreams] smart_widget: Failed to add item: {e}', xbmc.LOGDEBUG)
-                    continue
+                    except Exception as e:
+                        import traceback
+                        xbmc.log(f'[AIOStreams] smart_widget: Failed to add item: {e}', xbmc.LOGDEBUG)
+                        continue
             # Set NumItems property for the skin
             count_prop = f"AIOStreams.{page}.{index}.NumItems"
             item_count = len(catalog_data["metas"])
@@ -5016,6 +5088,7 @@ def configured_widget():
     Returns:
         Widget content based on configuration
     """
+    from resources.lib import trakt
     from resources.lib.widget_config_loader import get_widget_at_index
 
     params = dict(parse_qsl(sys.argv[2][1:]))
@@ -5087,23 +5160,24 @@ def configured_widget():
                 xbmcplugin.setContent(HANDLE, 'tvshows' if content_type == 'series' else 'movies')
 
                 # Add items
-                for meta in catalog_data['metas']:
-                    item_id = meta.get('id')
-                    if not item_id:
-                        continue
-
-                    # For series: navigate to show
-                    if content_type == 'series':
-                        url = get_url(action='show_seasons', meta_id=item_id)
-                        is_folder = True
-                    else:
-                        url = get_url(action='show_streams', content_type='movie', media_id=item_id,
-                                     title=meta.get('name', ''), poster=meta.get('poster', ''),
-                                     fanart=meta.get('background', ''), clearlogo=meta.get('logo', ''))
-                        is_folder = False
-
-                    list_item = create_listitem_with_context(meta, content_type, url)
-                    xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
+                with trakt.row_cache_batch():
+                    for meta in catalog_data['metas']:
+                        item_id = meta.get('id')
+                        if not item_id:
+                            continue
+
+                        # For series: navigate to show
+                        if content_type == 'series':
+                            url = get_url(action='show_seasons', meta_id=item_id)
+                            is_folder = True
+                        else:
+                            url = get_url(action='show_streams', content_type='movie', media_id=item_id,
+                                         title=meta.get('name', ''), poster=meta.get('poster', ''),
+                                         fanart=meta.get('background', ''), clearlogo=meta.get('logo', ''))
+                            is_folder = False
+
+                        list_item = create_listitem_with_context(meta, content_type, url)
+                        xbmcplugin.addDirectoryItem(HANDLE, url, list_item, is_folder)
 
                 xbmcplugin.endOfDirectory(HANDLE)
                 return
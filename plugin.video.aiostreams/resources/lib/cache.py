@@ -5,14 +5,77 @@ Three-tier architecture: Memory -> Disk -> Network
 Based on Seren's cache patterns for optimal performance.
 """
 import os
+import sys
 import json
+import atexit
 import time
 import hashlib
 import functools
 import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 import xbmc
 import xbmcaddon
 import xbmcvfs
+from resources.lib.utils import debug_logging_enabled
+
+
+def _encode_data(data):
+    """Serialize cache data to the compact JSON bytes shared by both tiers."""
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+# Payloads above this size are zlib-compressed in the disk store and tagged
+# with a magic prefix; JSON text can never start with it
+_COMPRESS_MIN_SIZE = 4096
+_COMPRESS_MAGIC = b'ZLB1'
+
+
+def _compress_payload(payload):
+    """Compress a large serialized payload for the disk store."""
+    if len(payload) <= _COMPRESS_MIN_SIZE:
+        return payload
+    return _COMPRESS_MAGIC + zlib.compress(payload, 1)
+
+
+def _decompress_payload(blob):
+    """Reverse _compress_payload; uncompressed payloads pass through."""
+    if blob[:4] == _COMPRESS_MAGIC:
+        return zlib.decompress(blob[4:])
+    return blob
+
+
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _hash_call_args(args, kwargs):
+    """
+    Hash call arguments into a short hex digest for the cached decorator.
+
+    Arguments are fed to the hash one at a time rather than formatting the
+    whole call into a single string first. Primitive values take a cheap
+    type-tagged path; anything else falls back to repr().
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for value in args:
+        _hash_value(h, value)
+    for key in sorted(kwargs):
+        h.update(key.encode('utf-8'))
+        h.update(b'=')
+        _hash_value(h, kwargs[key])
+    return h.hexdigest()
+
+
+def _hash_value(h, value):
+    """Feed one argument into hash h (see _hash_call_args)."""
+    if type(value) in _PRIMITIVE_TYPES:
+        # Tag with the type so 1 and '1' produce different keys
+        h.update(type(value).__name__.encode('ascii'))
+        h.update(b':')
+        h.update(str(value).encode('utf-8', 'surrogatepass'))
+    else:
+        h.update(repr(value).encode('utf-8', 'surrogatepass'))
+    h.update(b'\x00')
 
 
 class MemoryCache:
@@ -21,18 +84,29 @@ class MemoryCache:
     Thread-safe with automatic expiration.
     """
 
-    def __init__(self, max_size=500):
+    def __init__(self, max_size=500, max_bytes=16 * 1024 * 1024):
         """
         Initialize memory cache.
 
         Args:
             max_size: Maximum number of entries to keep in memory
+            max_bytes: Approximate cap on the serialized size of all entries
         """
         self._cache = {}
         self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._bytes = 0
         self._lock = threading.RLock()
         self._access_order = []  # For LRU eviction
 
+    @staticmethod
+    def _estimate_size(data):
+        """Approximate the memory footprint of data by its JSON-encoded length."""
+        try:
+            return len(json.dumps(data, separators=(',', ':')))
+        except (TypeError, ValueError):
+            return sys.getsizeof(data)
+
     def get(self, key, ttl_seconds=None):
         """
         Get value from memory cache.
@@ -63,7 +137,7 @@ class MemoryCache:
 
             return entry.get('data')
 
-    def set(self, key, data, timestamp=None):
+    def set(self, key, data, timestamp=None, size=None):
         """
         Set value in memory cache.
 
@@ -71,26 +145,33 @@ class MemoryCache:
             key: Cache key
             data: Data to cache
             timestamp: Optional timestamp (defaults to now)
+            size: Optional size in bytes of data (estimated when omitted)
         """
+        if size is None:
+            size = self._estimate_size(data)
+
         with self._lock:
-            # Evict oldest entries if at capacity
-            while len(self._cache) >= self._max_size and self._access_order:
-                oldest_key = self._access_order.pop(0)
-                self._cache.pop(oldest_key, None)
+            self._remove(key)
+
+            # Evict oldest entries if at capacity (by entry count or bytes)
+            while self._access_order and (
+                len(self._cache) >= self._max_size or self._bytes + size > self._max_bytes
+            ):
+                self._remove(self._access_order[0])
 
             self._cache[key] = {
                 'data': data,
-                'timestamp': timestamp or time.time()
+                'timestamp': timestamp or time.time(),
+                'size': size
             }
-
-            # Update access order
-            if key in self._access_order:
-                self._access_order.remove(key)
+            self._bytes += size
             self._access_order.append(key)
 
     def _remove(self, key):
         """Remove entry from cache."""
-        self._cache.pop(key, None)
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry['size']
         if key in self._access_order:
             self._access_order.remove(key)
 
@@ -111,13 +192,16 @@ class MemoryCache:
         with self._lock:
             self._cache.clear()
             self._access_order.clear()
+            self._bytes = 0
 
     def get_stats(self):
         """Get cache statistics."""
         with self._lock:
             return {
                 'entries': len(self._cache),
-                'max_size': self._max_size
+                'max_size': self._max_size,
+                'bytes': self._bytes,
+                'max_bytes': self._max_bytes
             }
 
 
@@ -127,6 +211,16 @@ class TieredCache:
     Automatically promotes frequently accessed data to faster tiers.
     """
 
+    # Per-entry JSON files ({type}_{md5}.json) written before the SQLite store;
+    # imported the first time a store is opened in their directory
+    LEGACY_FILE_EXT = '.json'
+
+    # Threads used to read legacy cache files during that import
+    MIGRATION_WORKERS = 8
+
+    # Cache types kept in the directory shared by all Kodi profiles
+    SHARED_TYPES = ('metadata', 'http_headers', 'clearlogo_404')
+
     # Default TTLs by cache type
     DEFAULT_TTLS = {
         'manifest': 86400,      # 24 hours
@@ -135,8 +229,15 @@ class TieredCache:
         'http_headers': 31536000,  # 1 year
         'search': 3600,         # 1 hour
         'streams': 300,         # 5 minutes
+        'clearlogo_404': 86400,  # 24 hours
     }
 
+    # TTL for cache types not listed above
+    FALLBACK_TTL = 86400
+
+    # Seconds flush() waits for queued disk writes before giving up
+    FLUSH_TIMEOUT = 10
+
     def __init__(self, memory_size=200):
         """
         Initialize tiered cache.
@@ -145,16 +246,30 @@ class TieredCache:
             memory_size: Max entries for memory cache (default 200 for modern systems)
         """
         self._memory = MemoryCache(max_size=memory_size)
+        self._default_ttls = self.DEFAULT_TTLS
         self._cache_dir = None
+        self._cache_dirs = {}  # cache_type -> resolved directory
+        self._stores = {}  # cache directory -> CacheDatabase
+        self._store_lock = threading.Lock()
+
+        # Disk writes are deferred to a background writer so set() returns
+        # as soon as the memory tier is updated. Only the latest value per
+        # (cache_type, identifier) is kept, so hot keys are serialized once.
+        # The writer thread is started by the first queued write and returns once
+        # the queue is empty, so no idle thread outlives a plugin run.
         self._pending_writes = {}
+        self._inflight_writes = {}
         self._write_lock = threading.Lock()
+        self._write_cond = threading.Condition(self._write_lock)
+        self._writer = None
 
     def _get_cache_dir(self, cache_type=None):
         """
         Get cache directory path, creating if needed.
         
         Uses shared cache for metadata and HTTP headers (accessible by all Kodi profiles).
-        Uses profile-specific cache for other data types.
+        Uses profile-specific cache for other data types. The resolved path is
+        memoized per cache type so the Kodi path/VFS calls only run once.
         
         Args:
             cache_type: Type of cache (metadata, http_headers, etc.)
@@ -162,8 +277,16 @@ class TieredCache:
         Returns:
             str: Cache directory path
         """
-        # Use shared cache for metadata and HTTP headers across all Kodi profiles
-        if cache_type in ['metadata', 'http_headers']:
+        cache_dir = self._cache_dirs.get(cache_type)
+        if cache_dir is None:
+            cache_dir = self._resolve_cache_dir(cache_type)
+            self._cache_dirs[cache_type] = cache_dir
+        return cache_dir
+
+    def _resolve_cache_dir(self, cache_type):
+        """Resolve (and create) the cache directory for a cache type."""
+        # Use shared cache for metadata, HTTP headers and logo 404s across all Kodi profiles
+        if cache_type in self.SHARED_TYPES:
             try:
                 from resources.lib.shared_cache import SharedCacheManager
                 shared_dir = SharedCacheManager.get_shared_cache_dir()
@@ -191,15 +314,78 @@ class TieredCache:
 
         return self._cache_dir
 
-    def _get_cache_key(self, cache_type, identifier):
-        """Generate cache filename from type and identifier."""
-        key_string = f"{cache_type}:{identifier}"
-        key_hash = hashlib.md5(key_string.encode()).hexdigest()
-        return f"{cache_type}_{key_hash}.json"
+    def _get_store(self, cache_type=None):
+        """
+        Get the SQLite store for a cache type, opening it on first use.
+
+        Each cache directory holds one store; the first open in a directory
+        imports any per-entry cache files left from older versions.
+        """
+        cache_dir = self._get_cache_dir(cache_type)
+        store = self._stores.get(cache_dir)
+        if store is not None:
+            return store
+
+        with self._store_lock:
+            store = self._stores.get(cache_dir)
+            if store is None:
+                from resources.lib.database.cache_db import CacheDatabase
+                store = CacheDatabase(cache_dir)
+                if store.connect() and not store.is_migrated():
+                    self._migrate_files(store)
+                    store.set_migrated()
+                self._stores[cache_dir] = store
+        return store
+
+    def _get_stores(self):
+        """Return the distinct stores for the profile and shared cache directories."""
+        stores = []
+        for cache_type in (None,) + self.SHARED_TYPES:
+            store = self._get_store(cache_type)
+            if store not in stores:
+                stores.append(store)
+        return stores
+
+    def _migrate_files(self, store):
+        """Import per-entry cache files into store, then remove them."""
+        try:
+            with os.scandir(store.cache_dir) as it:
+                entries = [entry for entry in it
+                           if entry.name.endswith(self.LEGACY_FILE_EXT)]
+        except OSError:
+            return
+        if not entries:
+            return
 
-    def _get_memory_key(self, cache_type, identifier):
-        """Generate memory cache key."""
-        return f"{cache_type}:{identifier}"
+        # I/O-bound on slow profile storage, so read files concurrently
+        with ThreadPoolExecutor(max_workers=self.MIGRATION_WORKERS) as pool:
+            rows = [row for row in pool.map(self._migrate_file, entries) if row is not None]
+
+        if rows:
+            store.put_entries(rows)
+        xbmc.log(
+            f'[AIOStreams] Imported {len(rows)} of {len(entries)} cache files into {store.db_path}',
+            xbmc.LOGINFO
+        )
+
+    def _migrate_file(self, entry):
+        """Read and remove one legacy cache file; returns a store row or None."""
+        row = None
+        try:
+            with open(entry.path, 'r', encoding='utf-8') as f:
+                cache_data = json.load(f)
+            cache_type = cache_data['cache_type']
+            identifier = cache_data['identifier']
+            payload = _encode_data(cache_data.get('data'))
+            row = (f"{cache_type}:{identifier}", cache_type, float(cache_data.get('timestamp', 0)),
+                   _compress_payload(payload))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            xbmc.log(f'[AIOStreams] Skipping unreadable cache file {entry.name}: {e}', xbmc.LOGDEBUG)
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+        return row
 
     def get(self, cache_type, identifier, ttl_seconds=None):
         """
@@ -214,48 +400,97 @@ class TieredCache:
             Cached data or None if not found/expired
         """
         if ttl_seconds is None:
-            ttl_seconds = self.DEFAULT_TTLS.get(cache_type, 86400)
+            ttl_seconds = self._default_ttls.get(cache_type, self.FALLBACK_TTL)
 
-        memory_key = self._get_memory_key(cache_type, identifier)
+        memory_key = f"{cache_type}:{identifier}"
 
         # Tier 1: Memory cache (instant)
         data = self._memory.get(memory_key, ttl_seconds)
         if data is not None:
-            xbmc.log(f'[AIOStreams] Cache HIT (memory): {cache_type}:{identifier}', xbmc.LOGDEBUG)
+            if debug_logging_enabled():
+                xbmc.log(f'[AIOStreams] Cache HIT (memory): {cache_type}:{identifier}', xbmc.LOGDEBUG)
             return data
 
+        # Writes still queued for the disk tier are newer than what is on disk
+        pending = self._get_pending(cache_type, identifier)
+        if pending is not None:
+            data, timestamp = pending
+            if time.time() - timestamp < ttl_seconds:
+                self._memory.set(memory_key, data, timestamp)
+                return data
+            return None
+
         # Tier 2: Disk cache
-        data = self._get_from_disk(cache_type, identifier, ttl_seconds)
-        if data is not None:
-            # Promote to memory cache
-            self._memory.set(memory_key, data)
-            xbmc.log(f'[AIOStreams] Cache HIT (disk): {cache_type}:{identifier}', xbmc.LOGDEBUG)
+        hit = self._get_from_disk(cache_type, memory_key, ttl_seconds)
+        if hit is not None:
+            data, size = hit
+            # Promote to memory cache, sized by the bytes already read
+            self._memory.set(memory_key, data, size=size)
+            if debug_logging_enabled():
+                xbmc.log(f'[AIOStreams] Cache HIT (disk): {cache_type}:{identifier}', xbmc.LOGDEBUG)
             return data
 
-        xbmc.log(f'[AIOStreams] Cache MISS: {cache_type}:{identifier}', xbmc.LOGDEBUG)
+        if debug_logging_enabled():
+            xbmc.log(f'[AIOStreams] Cache MISS: {cache_type}:{identifier}', xbmc.LOGDEBUG)
         return None
 
-    def _get_from_disk(self, cache_type, identifier, ttl_seconds):
-        """Get data from disk cache."""
-        cache_dir = self._get_cache_dir(cache_type)
-        cache_file = os.path.join(cache_dir, self._get_cache_key(cache_type, identifier))
+    def prefetch(self, cache_type, identifiers, ttl_seconds=None):
+        """
+        Warm the memory tier for a batch of entries with one disk query.
 
-        if not xbmcvfs.exists(cache_file):
-            return None
+        Call before a loop of get() calls (e.g. rendering a catalog page) so
+        the individual lookups are served from memory.
 
+        Args:
+            cache_type: Type of cache
+            identifiers: Iterable of identifiers about to be read
+            ttl_seconds: Optional TTL override (defaults based on cache_type)
+
+        Returns:
+            int: Number of entries loaded into memory
+        """
+        if ttl_seconds is None:
+            ttl_seconds = self._default_ttls.get(cache_type, self.FALLBACK_TTL)
+
+        keys = []
+        for identifier in identifiers:
+            key = f"{cache_type}:{identifier}"
+            if (self._memory.get(key, ttl_seconds) is None
+                    and self._get_pending(cache_type, identifier) is None):
+                keys.append(key)
+        if not keys:
+            return 0
+
+        loaded = 0
+        now = time.time()
         try:
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
+            for key, (timestamp, blob) in self._get_store(cache_type).get_entries(keys).items():
+                if now - timestamp < ttl_seconds:
+                    payload = _decompress_payload(blob)
+                    self._memory.set(key, json.loads(payload), timestamp, size=len(payload))
+                    loaded += 1
+        except Exception as e:
+            xbmc.log(f'[AIOStreams] Cache prefetch error: {e}', xbmc.LOGERROR)
 
-            timestamp = cache_data.get('timestamp', 0)
+        if debug_logging_enabled():
+            xbmc.log(f'[AIOStreams] Cache prefetch: {loaded}/{len(keys)} {cache_type} entries', xbmc.LOGDEBUG)
+        return loaded
 
-            # Check if cache is still valid
+    def _get_from_disk(self, cache_type, key, ttl_seconds):
+        """Get (data, payload size) from the disk store, or None if missing/expired."""
+        try:
+            entry = self._get_store(cache_type).get_entry(key)
+            if entry is None:
+                return None
+
+            timestamp, blob = entry
             if time.time() - timestamp < ttl_seconds:
-                return cache_data.get('data')
-            else:
-                # Expired, delete file
-                xbmcvfs.delete(cache_file)
-                xbmc.log(f'[AIOStreams] Cache EXPIRED: {cache_type}:{identifier}', xbmc.LOGDEBUG)
+                payload = _decompress_payload(blob)
+                return json.loads(payload), len(payload)
+
+            # Expired; left in place for cleanup_expired (or the next set) to replace
+            if debug_logging_enabled():
+                xbmc.log(f'[AIOStreams] Cache EXPIRED: {key}', xbmc.LOGDEBUG)
         except Exception as e:
             xbmc.log(f'[AIOStreams] Cache read error: {e}', xbmc.LOGERROR)
 
@@ -269,68 +504,103 @@ class TieredCache:
             cache_type: Type of cache
             identifier: Unique identifier
             data: Data to cache
-            checksum: Optional checksum for data validation
+            checksum: Optional checksum (accepted for compatibility, not persisted)
         """
-        memory_key = self._get_memory_key(cache_type, identifier)
+        memory_key = f"{cache_type}:{identifier}"
         timestamp = time.time()
 
+        # Serialize once; the byte length sizes the memory entry and the
+        # same bytes are written to disk
+        try:
+            payload = _encode_data(data)
+        except (TypeError, ValueError) as e:
+            xbmc.log(f'[AIOStreams] Cache serialize error for {cache_type}:{identifier}: {e}', xbmc.LOGERROR)
+            self._memory.set(memory_key, data, timestamp)
+            return
+
         # Store in memory immediately
-        self._memory.set(memory_key, data, timestamp)
+        self._memory.set(memory_key, data, timestamp, size=len(payload))
 
         # Store on disk
-        self._save_to_disk(cache_type, identifier, data, timestamp, checksum)
-
-    def _get_file_lock(self, filepath):
-        """Get a lock for a specific file path."""
+        self._save_to_disk(cache_type, identifier, data, payload, timestamp, checksum)
+
+    def _save_to_disk(self, cache_type, identifier, data, payload, timestamp, checksum=None):
+        """Queue data for the background writer, replacing any pending value for the key."""
+        with self._write_cond:
+            self._pending_writes[(cache_type, identifier)] = (data, payload, timestamp, checksum)
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_worker, name='AIOStreamsCacheWriter')
+                self._writer.daemon = True
+                self._writer.start()
+
+    def _get_pending(self, cache_type, identifier):
+        """Return (data, timestamp) for a write not yet on disk, or None."""
+        key = (cache_type, identifier)
         with self._write_lock:
-            if filepath not in self._pending_writes:
-                self._pending_writes[filepath] = threading.Lock()
-            return self._pending_writes[filepath]
+            entry = self._pending_writes.get(key) or self._inflight_writes.get(key)
+        if entry is None:
+            return None
+        return entry[0], entry[2]
 
-    def _save_to_disk(self, cache_type, identifier, data, timestamp, checksum=None):
-        """Save data to disk cache."""
-        cache_dir = self._get_cache_dir(cache_type)
-        cache_file = os.path.join(cache_dir, self._get_cache_key(cache_type, identifier))
+    def _discard_pending(self, predicate):
+        """
+        Drop queued writes whose (cache_type, identifier) key matches predicate.
+
+        Also waits for a matching write already in flight, so a following
+        disk delete cannot be undone by the writer thread.
+        """
+        with self._write_cond:
+            for key in [k for k in self._pending_writes if predicate(k)]:
+                del self._pending_writes[key]
+            while any(predicate(k) for k in self._inflight_writes):
+                self._write_cond.wait()
+
+    def _write_worker(self):
+        """
+        Swap out the pending writes and flush them to disk in one transaction per store,
+        returning once nothing is left queued (the next set() starts a new writer).
+        """
+        while True:
+            with self._write_cond:
+                if not self._pending_writes:
+                    self._writer = None
+                    return
+                batch, self._pending_writes = self._pending_writes, {}
+                self._inflight_writes = batch
 
-        lock = self._get_file_lock(cache_file)
-        with lock:
             try:
-                cache_data = {
-                    'timestamp': timestamp,
-                    'cache_type': cache_type,
-                    'identifier': identifier,
-                    'data': data
-                }
-
-                # Add checksum if provided or generate one
-                if checksum:
-                    cache_data['checksum'] = checksum
-                else:
-                    try:
-                        cache_data['checksum'] = hashlib.md5(
-                            json.dumps(data, sort_keys=True).encode()
-                        ).hexdigest()
-                    except:
-                        pass  # Skip checksum on serialization error
-
-                # Write atomically using a temporary file
-                temp_file = cache_file + '.tmp'
-                with open(temp_file, 'w') as f:
-                    json.dump(cache_data, f)
-                
-                # Retrieve permissions from original file if it exists, or use default (typically 0644/0666)
-                # But xbmcvfs doesn't give easy chmod access. Standard OS rename is usually atomic enough.
-                import shutil
-                shutil.move(temp_file, cache_file)
+                self._write_to_disk(batch)
+            except Exception as e:
+                # Keep the writer alive; losing one batch beats losing every later write
+                xbmc.log(f'[AIOStreams] Cache write error: {len(batch)} entries not saved: {e}', xbmc.LOGERROR)
+            finally:
+                with self._write_cond:
+                    self._inflight_writes = {}
+                    self._write_cond.notify_all()
+
+    def _write_to_disk(self, batch):
+        """
+        Write a batch of pending entries to their stores (runs on the writer thread).
 
-                xbmc.log(f'[AIOStreams] Cache SET: {cache_type}:{identifier}', xbmc.LOGDEBUG)
+        Checksums are accepted for API compatibility but not persisted;
+        nothing reads them back.
+        """
+        rows_by_store = {}
+        for (cache_type, identifier), (_, payload, timestamp, _checksum) in batch.items():
+            try:
+                store = self._get_store(cache_type)
             except Exception as e:
                 xbmc.log(f'[AIOStreams] Cache write error: {e}', xbmc.LOGERROR)
-                if os.path.exists(cache_file + '.tmp'):
-                    try:
-                        os.remove(cache_file + '.tmp')
-                    except:
-                        pass
+                continue
+            rows_by_store.setdefault(store, []).append(
+                (f"{cache_type}:{identifier}", cache_type, timestamp, _compress_payload(payload))
+            )
+
+        for store, rows in rows_by_store.items():
+            if store.put_entries(rows):
+                xbmc.log(f'[AIOStreams] Cache SET: {len(rows)} entries', xbmc.LOGDEBUG)
+            else:
+                xbmc.log(f'[AIOStreams] Cache write error: {len(rows)} entries not saved', xbmc.LOGERROR)
 
     def get_age(self, cache_type, identifier):
         """
@@ -343,147 +613,122 @@ class TieredCache:
         Returns:
             Age in seconds, or None if not cached
         """
-        cache_dir = self._get_cache_dir(cache_type)
-        cache_file = os.path.join(cache_dir, self._get_cache_key(cache_type, identifier))
-
-        if not xbmcvfs.exists(cache_file):
-            return None
+        pending = self._get_pending(cache_type, identifier)
+        if pending is not None:
+            return time.time() - pending[1]
 
         try:
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
-            timestamp = cache_data.get('timestamp', 0)
-            return time.time() - timestamp
-        except:
+            timestamp = self._get_store(cache_type).get_timestamp(f"{cache_type}:{identifier}")
+        except Exception:
+            return None
+        if timestamp is None:
             return None
+        return time.time() - timestamp
 
     def invalidate(self, cache_type, identifier):
         """Invalidate a specific cache entry from all tiers."""
-        memory_key = self._get_memory_key(cache_type, identifier)
+        memory_key = f"{cache_type}:{identifier}"
         self._memory.invalidate(memory_key)
-
-        cache_dir = self._get_cache_dir(cache_type)
-        cache_file = os.path.join(cache_dir, self._get_cache_key(cache_type, identifier))
-        if xbmcvfs.exists(cache_file):
-            xbmcvfs.delete(cache_file)
+        self._discard_pending(lambda key: key == (cache_type, identifier))
+        self._get_store(cache_type).delete(memory_key)
 
     def invalidate_type(self, cache_type):
         """Invalidate all entries of a specific type."""
         # Clear from memory
         self._memory.invalidate_prefix(f"{cache_type}:")
+        self._discard_pending(lambda key: key[0] == cache_type)
 
-        # Clear from disk
-        cache_dir = self._get_cache_dir()
-        try:
-            dirs, files = xbmcvfs.listdir(cache_dir)
-            for filename in files:
-                if filename.startswith(f"{cache_type}_") and filename.endswith('.json'):
-                    xbmcvfs.delete(os.path.join(cache_dir, filename))
-        except:
-            pass
+        # Clear from disk (SHARED_TYPES live in the shared store)
+        self._get_store(cache_type).delete_type(cache_type)
 
     def clear_memory(self):
         """Clear memory cache only."""
         self._memory.clear()
 
     def clear_all(self):
-        """Clear all caches (memory and disk)."""
+        """Clear all caches (memory and the profile disk store)."""
         self._memory.clear()
+        # Shared types live in the store every Kodi profile reads; keep their writes
+        self._discard_pending(lambda key: key[0] not in self.SHARED_TYPES)
         self.cleanup_expired(force_all=True)
 
     def cleanup_expired(self, force_all=False, max_age_days=30):
         """
-        Remove expired cache files from disk.
+        Remove expired entries from the disk stores.
+
+        An entry is removed once it is older than both max_age_days and the
+        default TTL of its cache type, so long-lived types such as http_headers
+        survive the routine sweep.
 
         Args:
-            force_all: If True, remove all cache files
+            force_all: If True, remove all entries from the profile store (the
+                shared store also holds other profiles' data and is left alone)
             max_age_days: Maximum age in days before cleanup
         """
-        cache_dir = self._get_cache_dir()
-
-        if not xbmcvfs.exists(cache_dir):
-            return
-
         try:
-            dirs, files = xbmcvfs.listdir(cache_dir)
             expired_count = 0
             cache_types = {}
+            now = time.time()
+            max_age = max_age_days * 86400
 
-            max_age_seconds = max_age_days * 86400
-
-            for filename in files:
-                if not filename.endswith('.json'):
-                    continue
-
-                file_path = os.path.join(cache_dir, filename)
-
-                if force_all:
-                    try:
-                        try:
-                            with open(file_path, 'r') as f:
-                                cache_data = json.load(f)
-                                cache_type = cache_data.get('cache_type', 'unknown')
-                                cache_types[cache_type] = cache_types.get(cache_type, 0) + 1
-                        except:
-                            cache_types['unknown'] = cache_types.get('unknown', 0) + 1
-
-                        os.remove(file_path)
-                        expired_count += 1
-                    except:
-                        pass
-                    continue
-
-                try:
-                    with open(file_path, 'r') as f:
-                        cache_data = json.load(f)
-
-                    timestamp = cache_data.get('timestamp', 0)
-
-                    if time.time() - timestamp >= max_age_seconds:
-                        xbmcvfs.delete(file_path)
-                        expired_count += 1
-                except:
-                    # Delete corrupted cache files
-                    xbmcvfs.delete(file_path)
+            if force_all:
+                for cache_type, count in self._get_store().delete_all().items():
+                    cache_types[cache_type] = count
+                    expired_count += count
+            else:
+                for store in self._get_stores():
+                    for cache_type in store.count_by_type():
+                        ttl = max(self._default_ttls.get(cache_type, self.FALLBACK_TTL), max_age)
+                        expired_count += store.delete_older_than(now - ttl, cache_type)
 
             if expired_count > 0:
                 if force_all:
                     type_summary = ', '.join([f'{count} {ctype}' for ctype, count in cache_types.items()])
-                    xbmc.log(f'[AIOStreams] Cleared {expired_count} cache files ({type_summary})', xbmc.LOGINFO)
+                    xbmc.log(f'[AIOStreams] Cleared {expired_count} cache entries ({type_summary})', xbmc.LOGINFO)
                 else:
-                    xbmc.log(f'[AIOStreams] Cleaned up {expired_count} expired cache files', xbmc.LOGINFO)
+                    xbmc.log(f'[AIOStreams] Cleaned up {expired_count} expired cache entries', xbmc.LOGINFO)
         except Exception as e:
             xbmc.log(f'[AIOStreams] Cache cleanup error: {e}', xbmc.LOGERROR)
 
-    def flush(self):
-        """Flush any pending writes (called on shutdown)."""
-        pass  # Currently writes are synchronous
+    def flush(self, timeout=FLUSH_TIMEOUT):
+        """
+        Block until all queued disk writes have been written (called on shutdown).
+
+        Args:
+            timeout: Maximum seconds to wait, so a stuck write cannot hang Kodi's exit
+
+        Returns:
+            bool: True if the queue drained, False if the wait timed out
+        """
+        deadline = time.monotonic() + timeout
+        with self._write_cond:
+            while self._pending_writes or self._inflight_writes:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    xbmc.log('[AIOStreams] Cache flush timed out with writes still queued', xbmc.LOGWARNING)
+                    return False
+                self._write_cond.wait(remaining)
+        return True
 
     def get_stats(self):
         """Get cache statistics."""
         memory_stats = self._memory.get_stats()
-        cache_dir = self._get_cache_dir()
 
-        disk_count = 0
+        disk_types = {}
         disk_size = 0
-
         try:
-            dirs, files = xbmcvfs.listdir(cache_dir)
-            for filename in files:
-                if filename.endswith('.json'):
-                    disk_count += 1
-                    file_path = os.path.join(cache_dir, filename)
-                    try:
-                        disk_size += os.path.getsize(file_path)
-                    except:
-                        pass
-        except:
+            for store in self._get_stores():
+                for cache_type, count in store.count_by_type().items():
+                    disk_types[cache_type] = disk_types.get(cache_type, 0) + count
+                disk_size += store.get_size()
+        except Exception:
             pass
 
         return {
             'memory': memory_stats,
             'disk': {
-                'entries': disk_count,
+                'entries': sum(disk_types.values()),
+                'types': disk_types,
                 'size_kb': disk_size / 1024
             }
         }
@@ -498,6 +743,8 @@ def get_cache():
     global _cache
     if _cache is None:
         _cache = TieredCache()
+        # Make sure deferred disk writes land before the interpreter exits
+        atexit.register(_cache.flush)
     return _cache
 
 
@@ -517,6 +764,9 @@ def cached(cache_type, ttl_seconds=None, key_func=None):
         def get_catalog(content_type, catalog_id):
             return api_call(...)
     """
+    # The TTL only depends on decorator arguments, so resolve it once here
+    ttl = ttl_seconds if ttl_seconds else TieredCache.DEFAULT_TTLS.get(cache_type, TieredCache.FALLBACK_TTL)
+
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -527,12 +777,9 @@ def cached(cache_type, ttl_seconds=None, key_func=None):
                 identifier = key_func(*args, **kwargs)
             else:
                 # Default: function name + arg hash
-                arg_str = f"{args}:{sorted(kwargs.items())}"
-                arg_hash = hashlib.md5(arg_str.encode()).hexdigest()[:16]
-                identifier = f"{func.__name__}:{arg_hash}"
+                identifier = f"{func.__name__}:{_hash_call_args(args, kwargs)}"
 
             # Check cache
-            ttl = ttl_seconds if ttl_seconds else TieredCache.DEFAULT_TTLS.get(cache_type, 86400)
             cached_data = cache.get(cache_type, identifier, ttl)
 
             if cached_data is not None:
@@ -554,9 +801,15 @@ def cached(cache_type, ttl_seconds=None, key_func=None):
 # Legacy API compatibility (for existing code)
 # ============================================================================
 
+_CACHE_DIR = None
+
+
 def get_cache_dir():
     """Get cache directory path (legacy compatibility)."""
-    return get_cache()._get_cache_dir()
+    global _CACHE_DIR
+    if _CACHE_DIR is None:
+        _CACHE_DIR = get_cache()._get_cache_dir()
+    return _CACHE_DIR
 
 
 def get_cached_data(cache_type, identifier, ttl_seconds=86400*365):
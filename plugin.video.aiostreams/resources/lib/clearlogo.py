@@ -3,11 +3,18 @@ import xbmcgui
 import xbmcaddon
 import xbmcvfs
 import os
+import sys
 import hashlib
+import functools
+import shutil
 import requests
 import threading
-import pickle
-import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from resources.lib.cache import get_cache
+from resources.lib.database.trakt_sync import deserialize
+from resources.lib.utils import debug_logging_enabled
 
 # Try to import modules
 try:
@@ -16,31 +23,59 @@ try:
 except ImportError:
     HAS_MODULES = False
 
-# Cache for 404 responses to avoid retrying failed logo fetches
-# Format: {cache_key: timestamp}
-_clearlogo_404_cache = {}
+# 404 responses are remembered in the tiered cache (memory + shared SQLite
+# store) so logos known to be missing are not re-requested after a restart
+_404_CACHE_TYPE = 'clearlogo_404'
 _404_cache_ttl = 86400  # 24 hours in seconds
 
+# Shared HTTP session so parallel logo downloads reuse keep-alive connections
+_session = None
+_session_lock = threading.Lock()
+_SESSION_POOL_HOSTS = 8   # Logos come from a handful of art CDNs
+_SESSION_POOL_SIZE = 32   # Connections kept per host for parallel downloads
+
+# Default number of concurrent downloads in the startup clearlogo check
+_DEFAULT_LOGO_WORKERS = 12
+
+
+def _get_session():
+    """Get the shared requests session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retry transient CDN errors; the final response is still checked by raise_for_status
+                retries = Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                                raise_on_status=False)
+                adapter = HTTPAdapter(pool_connections=_SESSION_POOL_HOSTS, pool_maxsize=_SESSION_POOL_SIZE,
+                                      max_retries=retries)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
 def _is_404_cached(content_type, meta_id):
     """Check if this logo previously returned 404."""
     cache_key = f"{content_type}_{meta_id}"
-    if cache_key in _clearlogo_404_cache:
-        age = time.time() - _clearlogo_404_cache[cache_key]
-        if age < _404_cache_ttl:
-            return True
-        else:
-            # Expired, remove it
-            del _clearlogo_404_cache[cache_key]
-    return False
+    return get_cache().get(_404_CACHE_TYPE, cache_key, _404_cache_ttl) is not None
 
 def _cache_404(content_type, meta_id):
     """Mark this logo as 404 (not found)."""
     cache_key = f"{content_type}_{meta_id}"
-    _clearlogo_404_cache[cache_key] = time.time()
-    xbmc.log(f'[AIOStreams] Cached 404 for clearlogo: {cache_key}', xbmc.LOGDEBUG)
+    get_cache().set(_404_CACHE_TYPE, cache_key, True)
+    if debug_logging_enabled():
+        xbmc.log(f'[AIOStreams] Cached 404 for clearlogo: {cache_key}', xbmc.LOGDEBUG)
+
+# Addon handle and clearlogo directory, resolved once per process
+_addon = None
+_clearlogo_dir = None
 
 def get_addon():
-    return xbmcaddon.Addon()
+    global _addon
+    if _addon is None:
+        _addon = xbmcaddon.Addon()
+    return _addon
 
 def get_setting(setting_id, default=None):
     """Get addon setting."""
@@ -52,7 +87,12 @@ def get_clearlogo_cache_dir():
     Get the clearlogo cache directory path, creating it if needed.
     
     Uses shared directory across all Kodi profiles to avoid duplicate downloads.
+    The resolved path is memoized so the Kodi path/VFS calls only run once.
     """
+    global _clearlogo_dir
+    if _clearlogo_dir is not None:
+        return _clearlogo_dir
+
     try:
         from resources.lib.shared_cache import SharedCacheManager
         clearlogo_dir = SharedCacheManager.get_shared_clearlogo_dir()
@@ -69,19 +109,57 @@ def get_clearlogo_cache_dir():
         xbmcvfs.mkdirs(clearlogo_dir)
         xbmc.log(f'[AIOStreams] Created clearlogo cache directory: {clearlogo_dir}', xbmc.LOGDEBUG)
     
+    _clearlogo_dir = clearlogo_dir
     return clearlogo_dir
 
+# (content_type, meta_id) -> path of logos known to be on disk. Only hits are
+# remembered, so a logo downloaded later is still found; reset by clear_clearlogo_cache
+_known_logo_paths = {}
+
+@functools.lru_cache(maxsize=4096)
+def _safe_id(content_type, meta_id):
+    """Filename-safe hash of a logo's (content_type, meta_id)."""
+    return hashlib.blake2b(f"{content_type}_{meta_id}".encode(), digest_size=16).hexdigest()
+
+def _adopt_legacy_clearlogo(clearlogo_path, content_type, meta_id):
+    """
+    Rename a logo saved under the old MD5 filename to clearlogo_path.
+
+    Returns True if a legacy file was adopted.
+    """
+    legacy_id = hashlib.md5(f"{content_type}_{meta_id}".encode()).hexdigest()
+    legacy_path = os.path.join(os.path.dirname(clearlogo_path), f"{legacy_id}.png")
+    try:
+        os.replace(legacy_path, clearlogo_path)
+        return True
+    except OSError:
+        return False
+
+def _lookup_clearlogo(content_type, meta_id):
+    """
+    Resolve a logo's cache path and whether it is on disk, hashing the key once.
+
+    Returns:
+        tuple: (clearlogo_path, exists)
+    """
+    key = (content_type, meta_id)
+    clearlogo_path = _known_logo_paths.get(key)
+    if clearlogo_path:
+        return clearlogo_path, True
+
+    clearlogo_path = os.path.join(get_clearlogo_cache_dir(), f"{_safe_id(content_type, meta_id)}.png")
+    
+    # The directory is an already-translated local path, so skip VFS dispatch
+    if os.path.exists(clearlogo_path) or _adopt_legacy_clearlogo(clearlogo_path, content_type, meta_id):
+        _known_logo_paths[key] = clearlogo_path
+        return clearlogo_path, True
+    return clearlogo_path, False
+
 def get_cached_clearlogo_path(content_type, meta_id):
     """Get the cached clearlogo file path if it exists."""
-    safe_id = hashlib.md5(f"{content_type}_{meta_id}".encode()).hexdigest()
-    clearlogo_dir = get_clearlogo_cache_dir()
-    clearlogo_path = os.path.join(clearlogo_dir, f"{safe_id}.png")
-    
-    if xbmcvfs.exists(clearlogo_path):
-        # Return the actual file path (works for both shared and profile-specific)
-        return clearlogo_path
-    
-    return None
+    clearlogo_path, exists = _lookup_clearlogo(content_type, meta_id)
+    # Return the actual file path (works for both shared and profile-specific)
+    return clearlogo_path if exists else None
 
 def download_and_cache_clearlogo(url, content_type, meta_id):
     """Download clearlogo image and cache it to local file."""
@@ -90,13 +168,14 @@ def download_and_cache_clearlogo(url, content_type, meta_id):
 
     # Check if this logo previously returned 404
     if _is_404_cached(content_type, meta_id):
-        xbmc.log(f'[AIOStreams] Skipping clearlogo fetch (cached 404): {content_type}/{meta_id}', xbmc.LOGDEBUG)
+        if debug_logging_enabled():
+            xbmc.log(f'[AIOStreams] Skipping clearlogo fetch (cached 404): {content_type}/{meta_id}', xbmc.LOGDEBUG)
         return None
 
     try:
-        cached_path = get_cached_clearlogo_path(content_type, meta_id)
-        if cached_path:
-            return cached_path
+        clearlogo_path, exists = _lookup_clearlogo(content_type, meta_id)
+        if exists:
+            return clearlogo_path
 
         # Determine timeout from settings
         try:
@@ -104,24 +183,34 @@ def download_and_cache_clearlogo(url, content_type, meta_id):
         except ValueError:
             timeout = 10
 
-        response = requests.get(url, timeout=timeout)
-        response.raise_for_status()
-
-        safe_id = hashlib.md5(f"{content_type}_{meta_id}".encode()).hexdigest()
-        clearlogo_dir = get_clearlogo_cache_dir()
-        clearlogo_path = os.path.join(clearlogo_dir, f"{safe_id}.png")
+        # Per-thread temp name so concurrent fetches of the same logo don't collide
+        temp_path = f"{clearlogo_path}.{threading.get_ident()}.tmp"
 
-        with open(clearlogo_path, 'wb') as f:
-            f.write(response.content)
+        # Stream the body straight to disk, then rename so readers never see a partial file
+        with _get_session().get(url, stream=True, timeout=timeout) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            try:
+                with open(temp_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, 64 * 1024)
+                os.replace(temp_path, clearlogo_path)
+                _known_logo_paths[(content_type, meta_id)] = clearlogo_path
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
 
-        xbmc.log(f'[AIOStreams] Cached clearlogo for {content_type}/{meta_id}: {clearlogo_path}', xbmc.LOGINFO)
+        # Per-logo detail is debug-only; the startup check logs one summary line
+        if debug_logging_enabled():
+            xbmc.log(f'[AIOStreams] Cached clearlogo for {content_type}/{meta_id}: {clearlogo_path}', xbmc.LOGDEBUG)
         return clearlogo_path
 
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
             # Cache 404 to avoid retrying
             _cache_404(content_type, meta_id)
-            xbmc.log(f'[AIOStreams] Clearlogo not found (404), caching failure: {content_type}/{meta_id}', xbmc.LOGDEBUG)
+            if debug_logging_enabled():
+                xbmc.log(f'[AIOStreams] Clearlogo not found (404), caching failure: {content_type}/{meta_id}', xbmc.LOGDEBUG)
         else:
             xbmc.log(f'[AIOStreams] Error caching clearlogo for {content_type}/{meta_id}: {e}', xbmc.LOGERROR)
         return None
@@ -129,16 +218,29 @@ def download_and_cache_clearlogo(url, content_type, meta_id):
         xbmc.log(f'[AIOStreams] Error caching clearlogo for {content_type}/{meta_id}: {e}', xbmc.LOGERROR)
         return None
 
+def _unlink_quietly(path):
+    """Remove a file, ignoring one that is already gone."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
 def clear_clearlogo_cache():
     """Delete all cached clearlogo files."""
-    import shutil
+    _known_logo_paths.clear()
     try:
         clearlogo_dir = get_clearlogo_cache_dir()
-        if xbmcvfs.exists(clearlogo_dir):
-            shutil.rmtree(clearlogo_dir)
-            xbmc.log('[AIOStreams] Cleared clearlogo cache', xbmc.LOGINFO)
-            xbmcvfs.mkdirs(clearlogo_dir)
+        try:
+            with os.scandir(clearlogo_dir) as it:
+                # In-progress downloads (.tmp) are left for their writer to rename or remove
+                paths = [entry.path for entry in it if entry.is_file() and not entry.name.endswith('.tmp')]
+        except FileNotFoundError:
             return True
+        
+        # Delete in place (no rmtree + mkdirs) on a few threads; unlink is metadata-I/O bound
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(_unlink_quietly, paths))
+        xbmc.log(f'[AIOStreams] Cleared clearlogo cache ({len(paths)} files)', xbmc.LOGINFO)
         return True
     except Exception as e:
         xbmc.log(f'[AIOStreams] Error clearing clearlogo cache: {e}', xbmc.LOGERROR)
@@ -157,31 +259,93 @@ def check_missing_clearlogos_on_startup():
             if not db:
                 return
             
-            missing_count = 0
-            downloaded_count = 0
+            # Logos already on disk, read with a single directory listing
+            clearlogo_dir = get_clearlogo_cache_dir()
+            try:
+                cached_ids = {name[:-4] for name in os.listdir(clearlogo_dir) if name.endswith('.png')}
+            except OSError:
+                cached_ids = set()
+            
+            # Collect missing logos first, then download them concurrently
+            missing = []
+            try:
+                # get_trakt_db() hands back this thread's already-open connection; reconnecting
+                # would leak it and repeat the PRAGMA setup
+                if db.connection or db.connect():
+                    # Phase 1: ids and logo URLs only (served from idx_metas_ctype_logo), filtered
+                    # against the logo directory
+                    uncached_ids = []
+                    cursor = db.execute(
+                        "SELECT id, content_type, logo_url FROM metas WHERE content_type IN (?, ?)",
+                        ('movie', 'series')
+                    )
+                    while cursor:
+                        rows = cursor.fetchmany(500)
+                        if not rows:
+                            break
+                        for row in rows:
+                            meta_id = row['id']
+                            # Only 'movie'/'series'; share one str object across all collected rows
+                            content_type = sys.intern(row['content_type'])
+                            
+                            safe_id = _safe_id(content_type, meta_id)
+                            if safe_id in cached_ids:
+                                continue
+                            if _adopt_legacy_clearlogo(os.path.join(clearlogo_dir, f"{safe_id}.png"), content_type, meta_id):
+                                continue
+                            
+                            logo_url = row['logo_url']
+                            if logo_url:
+                                missing.append((logo_url, content_type, meta_id))
+                            elif logo_url is None:
+                                # Stored before logo_url existed; read it from the metadata below
+                                uncached_ids.append(meta_id)
+                    
+                    # Phase 2: decode metadata BLOBs only for missing logos on rows without logo_url
+                    for start in range(0, len(uncached_ids), 500):
+                        chunk = uncached_ids[start:start + 500]
+                        placeholders = ','.join('?' * len(chunk))
+                        cursor = db.execute(
+                            f"SELECT id, content_type, metadata FROM metas WHERE id IN ({placeholders})",
+                            chunk
+                        )
+                        if not cursor:
+                            continue
+                        for row in cursor.fetchall():
+                            try:
+                                metadata = deserialize(row['metadata'])
+                                clearlogo_url = metadata.get('meta', {}).get('logo')
+                                if clearlogo_url:
+                                    missing.append((clearlogo_url, sys.intern(row['content_type']), row['id']))
+                            except:
+                                pass
+            except Exception as e:
+                xbmc.log(f'[AIOStreams] Error checking clearlogos: {e}', xbmc.LOGERROR)
             
-            for c_type in ['movie', 'series']:
+            missing_count = len(missing)
+            downloaded_count = 0
+            if missing:
+                # Load known 404s for the whole batch in one query
+                get_cache().prefetch(
+                    _404_CACHE_TYPE,
+                    [f"{content_type}_{meta_id}" for _, content_type, meta_id in missing],
+                    _404_cache_ttl
+                )
+
                 try:
-                    if db.connect():
-                        cursor = db.execute(f"SELECT id, content_type, metadata FROM metas WHERE content_type = '{c_type}'")
-                        if cursor:
-                            for row in cursor.fetchall():
-                                meta_id = row['id']
-                                content_type = row['content_type']
-                                
-                                if not get_cached_clearlogo_path(content_type, meta_id):
-                                    try:
-                                        metadata = pickle.loads(row['metadata'])
-                                        clearlogo_url = metadata.get('meta', {}).get('logo')
-                                        if clearlogo_url:
-                                            missing_count += 1
-                                            if download_and_cache_clearlogo(clearlogo_url, content_type, meta_id):
-                                                downloaded_count += 1
-                                    except:
-                                        pass
-                        db.disconnect()
-                except Exception as e:
-                    xbmc.log(f'[AIOStreams] Error checking {c_type} clearlogos: {e}', xbmc.LOGERROR)
+                    workers = int(get_setting('logo_workers', str(_DEFAULT_LOGO_WORKERS)))
+                except ValueError:
+                    workers = _DEFAULT_LOGO_WORKERS
+                
+                # Pool threads are joined at interpreter exit, so stop starting downloads on abort
+                monitor = xbmc.Monitor()
+                def download(job):
+                    if monitor.abortRequested():
+                        return None
+                    return download_and_cache_clearlogo(*job)
+                
+                with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                    downloaded_count = sum(1 for path in executor.map(download, missing) if path)
             
             if missing_count > 0:
                 xbmc.log(f'[AIOStreams] Clearlogo check complete: {downloaded_count}/{missing_count} downloaded', xbmc.LOGINFO)
@@ -190,6 +354,10 @@ def check_missing_clearlogos_on_startup():
                 
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error in background clearlogo check: {e}', xbmc.LOGERROR)
+        finally:
+            # Close the check thread's connection rather than leaving it to garbage collection
+            if HAS_MODULES:
+                trakt.close_trakt_db()
     
     try:
         if get_setting('startup_clearlogo_check', 'false') == 'true':
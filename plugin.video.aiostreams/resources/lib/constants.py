@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """Constants for AIOStreams addon"""
+import re
+from types import MappingProxyType
 
 # Quality rankings (higher is better)
-QUALITY_RANKS = {
+QUALITY_RANKS = MappingProxyType({
     '4k': 400,
     '2160p': 400,
     'uhd': 400,
@@ -14,10 +16,10 @@ QUALITY_RANKS = {
     'sd': 50,
     '360p': 30,
     '240p': 10
-}
+})
 
 # Quality display names
-QUALITY_LABELS = {
+QUALITY_LABELS = MappingProxyType({
     '4k': '[4K]',
     '2160p': '[4K]',
     'uhd': '[4K]',
@@ -29,7 +31,26 @@ QUALITY_LABELS = {
     'sd': '[SD]',
     '360p': '[360p]',
     '240p': '[240p]'
-}
+})
+
+# Quality token -> (rank, label), so callers get both from one lookup
+QUALITY = MappingProxyType({key: (rank, QUALITY_LABELS[key]) for key, rank in QUALITY_RANKS.items()})
+
+# Matches any quality token in a stream name, in a single scan. Tokens are delimited by
+# anything but a letter or digit (so '_' and '.' separate them, unlike \b); a resolution
+# such as '2160p' may also run straight into a tag ('2160pHDR').
+QUALITY_RE = re.compile(
+    r'(?<![a-z0-9])(' + '|'.join(
+        re.escape(key) + (r'(?![0-9])' if re.fullmatch(r'\d+p', key) else r'(?![a-z0-9])')
+        for key in sorted(QUALITY_RANKS, key=len, reverse=True)
+    ) + r')',
+    re.IGNORECASE
+)
+
+
+def resolve_quality(token, _quality=QUALITY, _default=(0, '')):
+    """Return (rank, label) for a quality token, case-insensitively; (0, '') if unknown."""
+    return _quality.get(token.lower(), _default)
 
 # Color codes for Kodi
 COLOR_WATCHED = 'dodgerblue'
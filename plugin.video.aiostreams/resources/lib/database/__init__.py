@@ -7,6 +7,7 @@ import os
 import sqlite3
 import xbmc
 import xbmcvfs
+from resources.lib.utils import debug_logging_enabled
 
 
 class Database:
@@ -41,27 +42,51 @@ class Database:
     def connect(self):
         """
         Establish connection to the SQLite database with WAL mode for concurrent access.
+        An already open connection is kept, so repeated calls are cheap.
 
         Returns:
             bool: True if connection successful, False otherwise
         """
+        if self.connection:
+            return True
+
         try:
+            is_new = not os.path.exists(self.db_path)
+
             # Connect with timeout to handle concurrent access
             self.connection = sqlite3.connect(
                 self.db_path,
                 timeout=10.0,  # 10 second timeout for lock contention
-                check_same_thread=False  # Allow multi-threaded access
+                check_same_thread=False,  # Allow multi-threaded access
+                cached_statements=256  # Prepared statements kept for reuse by SQL text
             )
             self.connection.row_factory = sqlite3.Row  # Enable dict-like row access
 
+            # Page size can only be chosen before the first write of a new file
+            if is_new:
+                self.connection.execute("PRAGMA page_size=8192")
+
             # Enable WAL mode for concurrent read/write support
-            # This prevents "database is locked" errors when service + UI access simultaneously
-            self.connection.execute("PRAGMA journal_mode=WAL")
-            self.connection.execute("PRAGMA synchronous=NORMAL")  # Faster than FULL, safe with WAL
+            # This prevents "database is locked" errors when service + UI access simultaneously.
+            # Filesystems without shared memory support (e.g. network shares) can refuse it;
+            # keep the connection in the default rollback journal mode in that case.
+            try:
+                journal_mode = self.connection.execute("PRAGMA journal_mode=WAL").fetchone()[0].lower()
+            except sqlite3.Error as e:
+                xbmc.log(f'[AIOStreams] Could not enable WAL mode for {self.db_name}: {e}', xbmc.LOGWARNING)
+                journal_mode = 'delete'
+            if journal_mode == 'wal':
+                self.connection.execute("PRAGMA synchronous=NORMAL")  # Faster than FULL, safe with WAL
+            else:
+                xbmc.log(f'[AIOStreams] Using {journal_mode} journal mode for {self.db_name}', xbmc.LOGWARNING)
+                self.connection.execute("PRAGMA synchronous=FULL")  # NORMAL is not crash-safe without WAL
             self.connection.execute("PRAGMA cache_size=-64000")   # 64MB cache for better performance
             self.connection.execute("PRAGMA temp_store=MEMORY")   # Store temp tables in memory
+            self.connection.execute("PRAGMA mmap_size=268435456")  # Read via a 256MB memory map instead of read() calls
+            self.connection.execute("PRAGMA wal_autocheckpoint=1000")  # Checkpoint every ~1000 pages so the WAL stays small
 
-            xbmc.log(f'[AIOStreams] Connected to database (WAL mode): {self.db_path}', xbmc.LOGDEBUG)
+            if debug_logging_enabled():
+                xbmc.log(f'[AIOStreams] Connected to database ({journal_mode} mode): {self.db_path}', xbmc.LOGDEBUG)
             return True
         except sqlite3.Error as e:
             xbmc.log(f'[AIOStreams] Database connection error: {e}', xbmc.LOGERROR)
@@ -73,7 +98,8 @@ class Database:
             try:
                 self.connection.close()
                 self.connection = None
-                xbmc.log(f'[AIOStreams] Disconnected from database: {self.db_path}', xbmc.LOGDEBUG)
+                if debug_logging_enabled():
+                    xbmc.log(f'[AIOStreams] Disconnected from database: {self.db_path}', xbmc.LOGDEBUG)
             except sqlite3.Error as e:
                 xbmc.log(f'[AIOStreams] Error closing database: {e}', xbmc.LOGERROR)
 
@@ -124,9 +150,10 @@ class Database:
             return cursor
         except sqlite3.Error as e:
             xbmc.log(f'[AIOStreams] SQL execution error: {e}', xbmc.LOGERROR)
-            xbmc.log(f'[AIOStreams] SQL: {sql}', xbmc.LOGDEBUG)
-            if params:
-                xbmc.log(f'[AIOStreams] Params: {params}', xbmc.LOGDEBUG)
+            if debug_logging_enabled():
+                xbmc.log(f'[AIOStreams] SQL: {sql}', xbmc.LOGDEBUG)
+                if params:
+                    xbmc.log(f'[AIOStreams] Params: {params}', xbmc.LOGDEBUG)
             return None
 
     def executemany(self, sql, params_list):
@@ -149,7 +176,8 @@ class Database:
             return cursor
         except sqlite3.Error as e:
             xbmc.log(f'[AIOStreams] SQL batch execution error: {e}', xbmc.LOGERROR)
-            xbmc.log(f'[AIOStreams] SQL: {sql}', xbmc.LOGDEBUG)
+            if debug_logging_enabled():
+                xbmc.log(f'[AIOStreams] SQL: {sql}', xbmc.LOGDEBUG)
             return None
 
     def fetch_one(self, sql, params=None):
@@ -188,6 +216,32 @@ class Database:
     fetchone = fetch_one
     fetchall = fetch_all
 
+    def begin(self):
+        """
+        Open a write transaction explicitly with BEGIN IMMEDIATE.
+
+        The write lock is taken up front (waiting out the connection timeout if
+        another process holds it), so a bulk load runs as one transaction instead
+        of failing with "database is locked" halfway through. Does nothing if a
+        transaction is already open.
+
+        Returns:
+            bool: True if a transaction is open, False otherwise
+        """
+        if not self.connection:
+            xbmc.log('[AIOStreams] No database connection', xbmc.LOGERROR)
+            return False
+
+        if self.connection.in_transaction:
+            return True
+
+        try:
+            self.connection.execute('BEGIN IMMEDIATE')
+            return True
+        except sqlite3.Error as e:
+            xbmc.log(f'[AIOStreams] Begin transaction error: {e}', xbmc.LOGERROR)
+            return False
+
     def commit(self):
         """
         Commit the current transaction.
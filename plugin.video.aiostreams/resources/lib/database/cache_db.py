@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite store backing the disk tier of the TieredCache.
+One database file per cache directory replaces the per-entry cache files.
+"""
+import os
+import threading
+from . import Database
+
+
+CACHE_SCHEMA = """
+    key TEXT PRIMARY KEY,
+    cache_type TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    data BLOB NOT NULL
+"""
+
+# PRAGMA user_version once the old per-entry files have been imported
+MIGRATED_VERSION = 1
+
+
+class CacheDatabase(Database):
+    """
+    Key/value cache table stored as cache.db inside a cache directory.
+
+    The connection is shared by the caller's thread and the cache writer
+    thread, so every operation is serialized on an internal lock.
+    """
+
+    DB_NAME = 'cache.db'
+
+    # Keys per IN (...) query; stays under SQLite's bound parameter limit
+    MAX_BATCH_PARAMS = 500
+
+    def __init__(self, cache_dir):
+        """
+        Initialize the cache store.
+
+        Args:
+            cache_dir: Directory holding the database file
+        """
+        self.cache_dir = cache_dir
+        self._lock = threading.RLock()
+        super().__init__(self.DB_NAME)
+
+    def _get_db_path(self):
+        """Store the database inside the cache directory rather than the profile root."""
+        return os.path.join(self.cache_dir, self.db_name)
+
+    def connect(self):
+        """Connect and make sure the cache table and its indexes exist."""
+        with self._lock:
+            if not super().connect():
+                return False
+            self.create_table('cache', CACHE_SCHEMA)
+            self.execute('CREATE INDEX IF NOT EXISTS idx_cache_timestamp ON cache(timestamp)')
+            self.execute('CREATE INDEX IF NOT EXISTS idx_cache_type ON cache(cache_type)')
+            self.commit()
+            return True
+
+    def is_migrated(self):
+        """Return True once legacy cache files have been imported."""
+        with self._lock:
+            row = self.fetch_one('PRAGMA user_version')
+            return bool(row) and row[0] >= MIGRATED_VERSION
+
+    def set_migrated(self):
+        """Record that legacy cache files have been imported."""
+        with self._lock:
+            self.execute(f'PRAGMA user_version = {MIGRATED_VERSION}')
+            self.commit()
+
+    def get_entry(self, key):
+        """
+        Look up a cache entry.
+
+        Returns:
+            tuple: (timestamp, data bytes), or None if not stored
+        """
+        with self._lock:
+            row = self.fetch_one('SELECT timestamp, data FROM cache WHERE key = ?', (key,))
+        if row is None:
+            return None
+        return row[0], bytes(row[1])
+
+    def get_entries(self, keys):
+        """
+        Look up several cache entries at once.
+
+        Returns:
+            dict: {key: (timestamp, data bytes)} for the keys that are stored
+        """
+        entries = {}
+        keys = list(keys)
+        with self._lock:
+            for start in range(0, len(keys), self.MAX_BATCH_PARAMS):
+                chunk = keys[start:start + self.MAX_BATCH_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                for row in self.fetch_all(
+                    f'SELECT key, timestamp, data FROM cache WHERE key IN ({placeholders})', chunk
+                ):
+                    entries[row[0]] = (row[1], bytes(row[2]))
+        return entries
+
+    def get_timestamp(self, key):
+        """Return the stored timestamp for key, or None if not stored."""
+        with self._lock:
+            row = self.fetch_one('SELECT timestamp FROM cache WHERE key = ?', (key,))
+        return row[0] if row else None
+
+    def put_entries(self, rows):
+        """
+        Insert or replace entries in a single transaction.
+
+        Args:
+            rows: Iterable of (key, cache_type, timestamp, data bytes)
+
+        Returns:
+            bool: True if the batch was committed
+        """
+        with self._lock:
+            if not self.begin():
+                return False
+            if self.executemany(
+                'INSERT OR REPLACE INTO cache (key, cache_type, timestamp, data) VALUES (?, ?, ?, ?)',
+                rows
+            ) is None:
+                self.rollback()
+                return False
+            return self.commit()
+
+    def delete(self, key):
+        """Delete a single entry."""
+        with self._lock:
+            self.execute('DELETE FROM cache WHERE key = ?', (key,))
+            self.commit()
+
+    def delete_type(self, cache_type):
+        """Delete every entry of a cache type."""
+        with self._lock:
+            self.execute('DELETE FROM cache WHERE cache_type = ?', (cache_type,))
+            self.commit()
+
+    def delete_older_than(self, cutoff, cache_type=None):
+        """
+        Delete entries written before cutoff.
+
+        Args:
+            cutoff: Timestamp; older entries are removed
+            cache_type: Optional cache type to limit the delete to
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            if cache_type is None:
+                cursor = self.execute('DELETE FROM cache WHERE timestamp < ?', (cutoff,))
+            else:
+                cursor = self.execute(
+                    'DELETE FROM cache WHERE cache_type = ? AND timestamp < ?', (cache_type, cutoff)
+                )
+            # Read before commit, while the lock keeps other writers off the connection
+            count = cursor.rowcount if cursor else 0
+            self.commit()
+        return count
+
+    def delete_all(self):
+        """
+        Delete every entry.
+
+        Returns:
+            dict: Number of entries removed per cache type
+        """
+        with self._lock:
+            counts = self.count_by_type()
+            self.execute('DELETE FROM cache')
+            self.commit()
+        return counts
+
+    def count_by_type(self):
+        """Return {cache_type: entry count}."""
+        with self._lock:
+            rows = self.fetch_all('SELECT cache_type, COUNT(*) FROM cache GROUP BY cache_type')
+        return {row[0]: row[1] for row in rows}
+
+    def get_size(self):
+        """Return the on-disk size of the database file (including WAL) in bytes."""
+        size = 0
+        for suffix in ('', '-wal'):
+            try:
+                size += os.path.getsize(self.db_path + suffix)
+            except OSError:
+                pass
+        return size
@@ -21,6 +21,7 @@ class DatabaseMigration:
         self.cache_dir = os.path.join(self.profile_path, 'cache')
         self.db = TraktSyncDatabase()
         self.migration_flag = os.path.join(self.profile_path, '.migration_complete')
+        self._migration_needed = None  # Result of is_migration_needed, computed once
     
     def is_migration_needed(self):
         """Check if migration has already been completed.
@@ -28,6 +29,12 @@ class DatabaseMigration:
         Returns:
             bool: True if migration is needed, False if already done
         """
+        if self._migration_needed is None:
+            self._migration_needed = self._check_migration_needed()
+        return self._migration_needed
+
+    def _check_migration_needed(self):
+        """Uncached body of is_migration_needed."""
         # If migration flag exists, migration is complete
         if xbmcvfs.exists(self.migration_flag):
             xbmc.log('[AIOStreams] Migration already completed', xbmc.LOGDEBUG)
@@ -39,17 +46,17 @@ class DatabaseMigration:
             self._mark_migration_complete()
             return False
         
-        # Check for any JSON files that might be old Trakt data
+        # Check for any JSON files that might be old Trakt data, stopping at the first one
         try:
-            dirs, files = xbmcvfs.listdir(self.cache_dir)
-            json_files = [f for f in files if f.endswith('.json')]
+            with os.scandir(self.cache_dir) as it:
+                has_json = any(entry.name.endswith('.json') and entry.is_file() for entry in it)
             
-            if not json_files:
+            if not has_json:
                 xbmc.log('[AIOStreams] No JSON cache files found, skipping migration', xbmc.LOGDEBUG)
                 self._mark_migration_complete()
                 return False
             
-            xbmc.log(f'[AIOStreams] Found {len(json_files)} JSON cache files, migration may be needed', xbmc.LOGINFO)
+            xbmc.log('[AIOStreams] Found JSON cache files, migration may be needed', xbmc.LOGINFO)
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error checking for migration: {e}', xbmc.LOGERROR)
@@ -57,6 +64,7 @@ class DatabaseMigration:
     
     def _mark_migration_complete(self):
         """Mark migration as complete by creating a flag file."""
+        self._migration_needed = False
         try:
             with open(self.migration_flag, 'w') as f:
                 f.write('Migration completed')
@@ -7,12 +7,204 @@ Note: Pickle is used for metadata serialization following Seren's approach.
 The metadata comes from Trakt API responses processed by this addon,
 not from external untrusted sources. All data is self-generated.
 """
+import json
 import pickle
+import sqlite3
+import threading
 import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import chain, islice
 import xbmc
+from resources.lib.utils import debug_logging_enabled
 from .. import Database
 
 
+# Newest pickle protocol: more compact BLOBs and faster loads than the default.
+# pickle.loads reads every protocol, so existing rows need no migration.
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Pickles at least this large (overviews, cast and episode lists) are stored
+# zlib-compressed behind a magic prefix. Protocol 2+ pickles start with 0x80,
+# so the prefix never collides with an uncompressed BLOB.
+_COMPRESS_MIN_SIZE = 1024
+_COMPRESS_MAGIC = b'ZLB1'
+
+# AIOStreams meta and catalog responses are plain JSON, so they are stored as
+# compact UTF-8 JSON behind their own prefixes: smaller than a pickle and
+# loading them cannot run code. Rows without a prefix are legacy pickles.
+_JSON_MAGIC = b'JSN1'
+_JSON_COMPRESS_MAGIC = b'JSZ1'
+
+# Cached responses are written once and read many times, so they use a higher
+# level than the sync BLOBs: ~8% smaller catalog pages, and no slower to inflate
+_JSON_COMPRESS_LEVEL = 6
+
+
+def serialize(obj):
+    """Serialize metadata for storage in a BLOB column."""
+    blob = pickle.dumps(obj, PICKLE_PROTOCOL)
+    if len(blob) < _COMPRESS_MIN_SIZE:
+        return blob
+    return _COMPRESS_MAGIC + zlib.compress(blob, 1)
+
+
+def serialize_json(obj):
+    """Serialize a JSON-compatible API response for storage in a BLOB column."""
+    blob = json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    if len(blob) < _COMPRESS_MIN_SIZE:
+        return _JSON_MAGIC + blob
+    return _JSON_COMPRESS_MAGIC + zlib.compress(blob, _JSON_COMPRESS_LEVEL)
+
+
+def deserialize(blob):
+    """Deserialize a BLOB column written by serialize(), serialize_json() or by earlier versions."""
+    magic = blob[:4]
+    if magic == _JSON_MAGIC:
+        return json.loads(blob[4:])
+    if magic == _JSON_COMPRESS_MAGIC:
+        return json.loads(zlib.decompress(blob[4:]))
+    if magic == _COMPRESS_MAGIC:
+        return pickle.loads(zlib.decompress(blob[4:]))
+    return pickle.loads(blob)
+
+
+def utc_now_iso():
+    """Current UTC time as ISO-8601 text, comparable with the stored Trakt air dates."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime())
+
+# Next Up query, one row per show; the only parameter is the current UTC time as
+# ISO-8601 text. A fixed SQL string lets sqlite3 reuse the prepared statement.
+_NEXT_UP_SQL = """
+    WITH max_season AS (
+        -- Find the latest watched season for each show
+        SELECT
+            show_trakt_id,
+            MAX(season) as max_season,
+            MAX(last_watched_at) as last_watched_at
+        FROM episodes
+        WHERE watched = 1 AND season > 0
+        GROUP BY show_trakt_id
+    ),
+    max_watched AS (
+        -- Find the last watched episode within that season
+        SELECT
+            ms.show_trakt_id,
+            ms.max_season,
+            MAX(e.episode) as max_episode,
+            ms.last_watched_at
+        FROM max_season ms
+        INNER JOIN episodes e
+            ON e.show_trakt_id = ms.show_trakt_id
+            AND e.watched = 1
+            AND e.season = ms.max_season
+        GROUP BY ms.show_trakt_id
+    ),
+    next_episode_candidate AS (
+        -- Find the next unwatched episode after the last watched one
+        -- Uses ROW_NUMBER to correctly get the first episode by season+episode order
+        SELECT
+            show_trakt_id,
+            season as next_season,
+            episode as next_episode
+        FROM (
+            SELECT
+                e.show_trakt_id,
+                e.season,
+                e.episode,
+                ROW_NUMBER() OVER (PARTITION BY e.show_trakt_id ORDER BY e.season, e.episode) as rn
+            FROM episodes e
+            INNER JOIN max_watched mw ON e.show_trakt_id = mw.show_trakt_id
+            WHERE e.season > 0
+                AND e.watched = 0
+                AND (
+                    -- Next episode in the same season
+                    (e.season = mw.max_season AND e.episode > mw.max_episode)
+                    -- OR first episode of next season
+                    OR (e.season > mw.max_season)
+                )
+                -- Only aired episodes (ISO-8601 strings compare in date order)
+                AND e.air_date < ?
+        )
+        WHERE rn = 1
+    ),
+    next_episode AS (
+        SELECT
+            e.show_trakt_id,
+            e.trakt_id,
+            e.tvdb_id,
+            e.tmdb_id,
+            e.imdb_id,
+            e.season,
+            e.episode,
+            e.air_date,
+            e.metadata
+        FROM next_episode_candidate nec
+        INNER JOIN episodes e
+            ON e.show_trakt_id = nec.show_trakt_id
+            AND e.season = nec.next_season
+            AND e.episode = nec.next_episode
+    ),
+    episode_bookmark AS (
+        -- One indexed lookup per id column instead of an OR join across all four,
+        -- then keep the best match per episode (trakt, tvdb, tmdb, imdb)
+        SELECT episode_trakt_id, percent_played, resume_time
+        FROM (
+            SELECT
+                episode_trakt_id,
+                percent_played,
+                resume_time,
+                ROW_NUMBER() OVER (PARTITION BY episode_trakt_id ORDER BY priority) as rn
+            FROM (
+                SELECT ne.trakt_id as episode_trakt_id, b.percent_played, b.resume_time, 1 as priority
+                FROM next_episode ne
+                INNER JOIN bookmarks b ON b.trakt_id = ne.trakt_id AND b.type = 'episode'
+                UNION ALL
+                SELECT ne.trakt_id, b.percent_played, b.resume_time, 2
+                FROM next_episode ne
+                INNER JOIN bookmarks b ON b.tvdb_id = ne.tvdb_id AND b.tvdb_id IS NOT NULL AND b.type = 'episode'
+                UNION ALL
+                SELECT ne.trakt_id, b.percent_played, b.resume_time, 3
+                FROM next_episode ne
+                INNER JOIN bookmarks b ON b.tmdb_id = ne.tmdb_id AND b.tmdb_id IS NOT NULL AND b.type = 'episode'
+                UNION ALL
+                SELECT ne.trakt_id, b.percent_played, b.resume_time, 4
+                FROM next_episode ne
+                INNER JOIN bookmarks b ON b.imdb_id = ne.imdb_id AND b.imdb_id IS NOT NULL AND b.type = 'episode'
+            )
+        )
+        WHERE rn = 1
+    )
+    SELECT
+        s.trakt_id as show_trakt_id,
+        s.imdb_id as show_imdb_id,
+        s.title as show_title,
+        e.trakt_id as episode_trakt_id,
+        e.season,
+        e.episode,
+        e.air_date,
+        e.imdb_id as episode_imdb_id,
+        e.metadata as episode_metadata,
+        mw.last_watched_at,
+        s.metadata as show_metadata,
+        b.percent_played,
+        b.resume_time
+    FROM next_episode e
+    INNER JOIN shows s ON s.trakt_id = e.show_trakt_id
+    INNER JOIN max_watched mw ON mw.show_trakt_id = e.show_trakt_id
+    LEFT JOIN episode_bookmark b ON b.episode_trakt_id = e.trakt_id
+    LEFT JOIN hidden h
+        ON h.trakt_id = e.show_trakt_id
+        AND h.section = 'progress_watched'
+    WHERE h.trakt_id IS NULL
+    ORDER BY mw.last_watched_at DESC
+"""
+
+# Most recently watched shows only; SQLite keeps a bounded top-N sorter instead of sorting every show
+_NEXT_UP_LIMIT_SQL = _NEXT_UP_SQL + "    LIMIT ?\n"
+
+
 class TraktSyncDatabase(Database):
     """Database for Trakt sync data with pickle BLOB storage."""
 
@@ -116,7 +308,8 @@ class TraktSyncDatabase(Database):
         id TEXT PRIMARY KEY,
         content_type TEXT,
         metadata BLOB,
-        expires INTEGER
+        expires INTEGER,
+        logo_url TEXT
     """
 
     CATALOGS_SCHEMA = """
@@ -129,6 +322,138 @@ class TraktSyncDatabase(Database):
         expires INTEGER
     """
 
+    # Stored in PRAGMA user_version once _run_migrations has applied every step;
+    # bump it whenever a migration step is added
+    SCHEMA_VERSION = 6
+
+    # Column lists read by the _unpack_*_row helpers, which pair each row with the *_FIELDS names below.
+    # Named explicitly because SELECT * order differs on databases upgraded by ALTER TABLE.
+    SHOW_COLUMNS = "trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, metadata, last_updated"
+    EPISODE_COLUMNS = "id, show_trakt_id, season, episode, trakt_id, imdb_id, tmdb_id, tvdb_id, metadata, last_updated"
+    MOVIE_COLUMNS = "trakt_id, imdb_id, tmdb_id, slug, title, metadata, last_updated"
+    WATCHLIST_COLUMNS = "id, trakt_id, mediatype, imdb_id, listed_at, last_updated, metadata"
+    # One name per column, in SELECT order; the keys of the unpacked dicts
+    SHOW_FIELDS = tuple(SHOW_COLUMNS.split(', '))
+    EPISODE_FIELDS = tuple(EPISODE_COLUMNS.split(', '))
+    MOVIE_FIELDS = tuple(MOVIE_COLUMNS.split(', '))
+    WATCHLIST_FIELDS = tuple(WATCHLIST_COLUMNS.split(', '))
+    # Listing columns without the metadata BLOB, for callers that only need ids and titles
+    SHOW_BRIEF_COLUMNS = "trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, last_updated"
+    MOVIE_BRIEF_COLUMNS = "trakt_id, imdb_id, tmdb_id, slug, title, last_updated"
+
+    # Lookup queries built once, so each call hands sqlite3 the same string and
+    # is served from its prepared statement cache
+    GET_SHOW_BY_TRAKT_SQL = f"SELECT {SHOW_COLUMNS} FROM shows WHERE trakt_id = ?"
+    GET_SHOW_BY_IMDB_SQL = f"SELECT {SHOW_COLUMNS} FROM shows WHERE imdb_id = ?"
+    GET_SHOWS_SQL = f"SELECT {SHOW_COLUMNS} FROM shows ORDER BY last_updated DESC"
+    GET_SHOWS_BRIEF_SQL = f"SELECT {SHOW_BRIEF_COLUMNS} FROM shows ORDER BY last_updated DESC"
+    GET_EPISODE_SQL = f"SELECT {EPISODE_COLUMNS} FROM episodes WHERE show_trakt_id = ? AND season = ? AND episode = ?"
+    GET_SHOW_EPISODES_SQL = f"SELECT {EPISODE_COLUMNS} FROM episodes WHERE show_trakt_id = ? ORDER BY season, episode"
+    GET_MOVIE_BY_TRAKT_SQL = f"SELECT {MOVIE_COLUMNS} FROM movies WHERE trakt_id = ?"
+    GET_MOVIE_BY_IMDB_SQL = f"SELECT {MOVIE_COLUMNS} FROM movies WHERE imdb_id = ?"
+    GET_MOVIES_SQL = f"SELECT {MOVIE_COLUMNS} FROM movies ORDER BY last_updated DESC"
+    GET_MOVIES_BRIEF_SQL = f"SELECT {MOVIE_BRIEF_COLUMNS} FROM movies ORDER BY last_updated DESC"
+    GET_WATCHLIST_SQL = f"SELECT {WATCHLIST_COLUMNS} FROM watchlist ORDER BY listed_at DESC"
+    GET_WATCHLIST_BY_TYPE_SQL = f"SELECT {WATCHLIST_COLUMNS} FROM watchlist WHERE mediatype = ? ORDER BY listed_at DESC"
+    GET_MOVIE_TRAKT_ID_SQL = "SELECT trakt_id FROM movies WHERE imdb_id = ?"
+    GET_SHOW_TRAKT_ID_SQL = "SELECT trakt_id FROM shows WHERE imdb_id = ?"
+    GET_BOOKMARK_BY_TRAKT_SQL = "SELECT resume_time, percent_played FROM bookmarks WHERE trakt_id = ?"
+    GET_BOOKMARK_BY_TVDB_SQL = "SELECT resume_time, percent_played FROM bookmarks WHERE tvdb_id = ?"
+    GET_BOOKMARK_BY_TMDB_SQL = "SELECT resume_time, percent_played FROM bookmarks WHERE tmdb_id = ?"
+    GET_BOOKMARK_BY_IMDB_SQL = "SELECT resume_time, percent_played FROM bookmarks WHERE imdb_id = ?"
+
+    # Aired and watched episode counts for a show by IMDB ID in one statement.
+    # No row means the show is unknown; a known show without aired episodes gives total 0.
+    # Parameters are the current UTC time from utc_now_iso() and the IMDB ID.
+    GET_IMDB_SHOW_PROGRESS_SQL = """
+        SELECT
+            COUNT(e.show_trakt_id) as total,
+            SUM(CASE WHEN e.watched = 1 THEN 1 ELSE 0 END) as watched_count
+        FROM shows s
+        LEFT JOIN episodes e
+            ON e.show_trakt_id = s.trakt_id
+            AND e.air_date <= ?
+        WHERE s.imdb_id = ?
+        GROUP BY s.trakt_id
+        LIMIT 1
+    """
+
+    # Upserts shared by the single-row and bulk insert methods. ON CONFLICT updates
+    # the existing row in place, where INSERT OR REPLACE would delete and re-insert
+    # it (new AUTOINCREMENT id, watched/collected columns reset to their defaults).
+    # The WHERE clause skips the update when the incoming row matches the stored one
+    # (metadata compared as serialized bytes), so an unchanged re-sync writes no pages.
+    # last_updated is part of the comparison: a newer value always lands, keeping the
+    # last_updated DESC listings in order.
+    INSERT_SHOW_SQL = """
+        INSERT INTO shows
+        (trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, metadata, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(trakt_id) DO UPDATE SET
+            imdb_id = excluded.imdb_id,
+            tvdb_id = excluded.tvdb_id,
+            tmdb_id = excluded.tmdb_id,
+            slug = excluded.slug,
+            title = excluded.title,
+            metadata = excluded.metadata,
+            last_updated = excluded.last_updated
+        WHERE (shows.imdb_id, shows.tvdb_id, shows.tmdb_id, shows.slug, shows.title, shows.metadata, shows.last_updated)
+            IS NOT (excluded.imdb_id, excluded.tvdb_id, excluded.tmdb_id, excluded.slug, excluded.title, excluded.metadata,
+                    excluded.last_updated)
+    """
+
+    INSERT_EPISODE_SQL = """
+        INSERT INTO episodes
+        (show_trakt_id, season, episode, trakt_id, imdb_id, tmdb_id, tvdb_id, metadata, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(show_trakt_id, season, episode) DO UPDATE SET
+            trakt_id = excluded.trakt_id,
+            imdb_id = excluded.imdb_id,
+            tmdb_id = excluded.tmdb_id,
+            tvdb_id = excluded.tvdb_id,
+            metadata = excluded.metadata,
+            last_updated = excluded.last_updated
+        WHERE (episodes.trakt_id, episodes.imdb_id, episodes.tmdb_id, episodes.tvdb_id, episodes.metadata,
+               episodes.last_updated)
+            IS NOT (excluded.trakt_id, excluded.imdb_id, excluded.tmdb_id, excluded.tvdb_id, excluded.metadata,
+                    excluded.last_updated)
+    """
+
+    INSERT_MOVIE_SQL = """
+        INSERT INTO movies
+        (trakt_id, imdb_id, tmdb_id, slug, title, metadata, last_updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(trakt_id) DO UPDATE SET
+            imdb_id = excluded.imdb_id,
+            tmdb_id = excluded.tmdb_id,
+            slug = excluded.slug,
+            title = excluded.title,
+            metadata = excluded.metadata,
+            last_updated = excluded.last_updated
+        WHERE (movies.imdb_id, movies.tmdb_id, movies.slug, movies.title, movies.metadata, movies.last_updated)
+            IS NOT (excluded.imdb_id, excluded.tmdb_id, excluded.slug, excluded.title, excluded.metadata,
+                    excluded.last_updated)
+    """
+
+    INSERT_WATCHLIST_SQL = """
+        INSERT INTO watchlist
+        (mediatype, trakt_id, listed_at, metadata, last_updated)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(trakt_id, mediatype) DO UPDATE SET
+            listed_at = excluded.listed_at,
+            metadata = excluded.metadata,
+            last_updated = excluded.last_updated
+        WHERE (watchlist.listed_at, watchlist.metadata, watchlist.last_updated)
+            IS NOT (excluded.listed_at, excluded.metadata, excluded.last_updated)
+    """
+
+    # SQL cache writes shared by set_meta/set_catalog and their bulk forms. The bulk
+    # forms append many "(?, ...)" groups to the prefix (see _write_values_bulk).
+    SET_META_PREFIX = "INSERT OR REPLACE INTO metas (id, content_type, metadata, expires, logo_url) VALUES "
+    SET_META_SQL = SET_META_PREFIX + "(?, ?, ?, ?, ?)"
+    SET_CATALOG_PREFIX = "INSERT OR REPLACE INTO catalogs (id, content_type, catalog_id, genre, skip, data, expires) VALUES "
+    SET_CATALOG_SQL = SET_CATALOG_PREFIX + "(?, ?, ?, ?, ?, ?, ?)"
+
     def clear_all_trakt_data(self):
         """Truncate all Trakt-related tables for a fresh sync."""
         if not self.connection and not self.connect():
@@ -136,28 +461,63 @@ class TraktSyncDatabase(Database):
             
         tables = ['shows', 'episodes', 'movies', 'bookmarks', 'activities', 'watchlist']
         try:
+            if not self.begin():
+                return False
+            # An unqualified DELETE on tables without triggers or foreign keys is
+            # SQLite's truncate optimization: pages are freed without visiting rows
             for table in tables:
                 self.execute(f"DELETE FROM {table}")
-            self.connection.commit()
+            if not self.commit():
+                self.rollback()
+                return False
             xbmc.log('[AIOStreams] All Trakt sync tables cleared successfully', xbmc.LOGDEBUG)
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error clearing Trakt tables: {e}', xbmc.LOGERROR)
+            self.rollback()
             return False
 
+    # True once this process has created the tables and applied the migrations
+    _schema_ready = False
+
+    # Unpacked get_show/get_movie/get_episode rows, raw meta/catalog BLOBs and
+    # IMDB lookups kept per connection, served inside row_cache_batch() blocks
+    ROW_CACHE_SIZE = 512
+
     def __init__(self):
-        """Initialize Trakt sync database."""
+        """Initialize Trakt sync database.
+
+        The schema is checked by the first instance in the process only. Its
+        connection stays open for the caller instead of being closed and reopened.
+        """
+        self._row_cache = OrderedDict()
+        self._row_cache_version = None
+        self._row_cache_batches = 0
+        self._row_cache_lock = threading.Lock()
         super().__init__('trakt_sync.db')
-        self._initialize_tables()
-        self._run_migrations()
+        if not TraktSyncDatabase._schema_ready:
+            if self._initialize_tables() and self._run_migrations():
+                TraktSyncDatabase._schema_ready = True
 
     def _initialize_tables(self):
-        """Create all required tables if they don't exist."""
+        """Create all required tables if they don't exist.
+
+        Returns:
+            bool: True if the tables were created or verified
+        """
         if not self.connect():
             xbmc.log('[AIOStreams] Failed to connect to Trakt sync database', xbmc.LOGERROR)
-            return
+            return False
+
+        # The version is only recorded after the tables exist, so a current
+        # database needs no CREATE TABLE round trips
+        if self._get_schema_version() >= self.SCHEMA_VERSION:
+            return True
 
         try:
+            # One write transaction for all the DDL instead of one per statement
+            if not self.begin():
+                return False
             self.create_table('shows', self.SHOWS_SCHEMA)
             self.create_table('episodes', self.EPISODES_SCHEMA)
             self.create_table('movies', self.MOVIES_SCHEMA)
@@ -169,195 +529,398 @@ class TraktSyncDatabase(Database):
             self.create_table('catalogs', self.CATALOGS_SCHEMA)
             self.commit()
             xbmc.log('[AIOStreams] Trakt sync database tables initialized', xbmc.LOGDEBUG)
+            return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error initializing Trakt sync tables: {e}', xbmc.LOGERROR)
             self.rollback()
-        finally:
-            self.disconnect()
+            return False
+
+    def _get_schema_version(self):
+        """Return the schema version stored in PRAGMA user_version (0 if unknown)."""
+        row = self.fetch_one("PRAGMA user_version")
+        return row[0] if row else 0
+
+    def _get_table_columns(self, tables):
+        """Return {table: set of column names} for the given tables."""
+        return {
+            table: {row[1] for row in self.fetch_all(f"PRAGMA table_info({table})")}
+            for table in tables
+        }
 
     def _run_migrations(self):
-        """Run database schema migrations for existing databases."""
+        """Run database schema migrations for existing databases.
+
+        Once every step has been applied the database records SCHEMA_VERSION in
+        PRAGMA user_version, and later startups return after a single pragma read.
+
+        Returns:
+            bool: True if the schema is up to date
+        """
         if not self.connect():
-            return
+            return False
 
         try:
+            if self._get_schema_version() >= self.SCHEMA_VERSION:
+                return True
+
+            columns = self._get_table_columns(('bookmarks', 'episodes', 'watchlist', 'metas'))
+
+            # Every step below, and the version bump, commits as one transaction
+            if not self.begin():
+                return False
+
+            steps = []
+
             # Migration: Add tvdb_id, tmdb_id, imdb_id to bookmarks table
-            # Check if columns exist
-            cursor = self.execute("PRAGMA table_info(bookmarks)")
-            if cursor:
-                columns = [row[1] for row in cursor.fetchall()]
-                
-                if 'tvdb_id' not in columns:
-                    xbmc.log('[AIOStreams] Migrating bookmarks table: adding tvdb_id column', xbmc.LOGDEBUG)
-                    self.execute("ALTER TABLE bookmarks ADD COLUMN tvdb_id INTEGER")
-                
-                if 'tmdb_id' not in columns:
-                    xbmc.log('[AIOStreams] Migrating bookmarks table: adding tmdb_id column', xbmc.LOGDEBUG)
-                    self.execute("ALTER TABLE bookmarks ADD COLUMN tmdb_id INTEGER")
-                
-                if 'imdb_id' not in columns:
-                    xbmc.log('[AIOStreams] Migrating bookmarks table: adding imdb_id column', xbmc.LOGDEBUG)
-                    self.execute("ALTER TABLE bookmarks ADD COLUMN imdb_id TEXT")
-                
-                self.commit()
+            if 'tvdb_id' not in columns['bookmarks']:
+                xbmc.log('[AIOStreams] Migrating bookmarks table: adding tvdb_id column', xbmc.LOGDEBUG)
+                steps.append("ALTER TABLE bookmarks ADD COLUMN tvdb_id INTEGER")
+
+            if 'tmdb_id' not in columns['bookmarks']:
+                xbmc.log('[AIOStreams] Migrating bookmarks table: adding tmdb_id column', xbmc.LOGDEBUG)
+                steps.append("ALTER TABLE bookmarks ADD COLUMN tmdb_id INTEGER")
+
+            if 'imdb_id' not in columns['bookmarks']:
+                xbmc.log('[AIOStreams] Migrating bookmarks table: adding imdb_id column', xbmc.LOGDEBUG)
+                steps.append("ALTER TABLE bookmarks ADD COLUMN imdb_id TEXT")
 
             # Migration: Add air_date column to episodes table (v3.1.0)
-            # Check if column exists first to avoid error logging
-            cursor = self.execute("PRAGMA table_info(episodes)")
-            if cursor:
-                columns = [row[1] for row in cursor.fetchall()]
-
-                if 'air_date' not in columns:
-                    self.execute("ALTER TABLE episodes ADD COLUMN air_date TEXT")
-                    self.commit()
-                    xbmc.log('[AIOStreams] Added air_date column to episodes table', xbmc.LOGDEBUG)
-                else:
-                    xbmc.log('[AIOStreams] air_date column already exists, skipping migration', xbmc.LOGDEBUG)
-
-                # Migration: Add metadata column to watchlist table
-                cursor = self.execute("PRAGMA table_info(watchlist)")
-                if cursor:
-                    columns = [row[1] for row in cursor.fetchall()]
-                    if 'metadata' not in columns:
-                        self.execute("ALTER TABLE watchlist ADD COLUMN metadata BLOB")
-                        self.commit()
-                        xbmc.log('[AIOStreams] Added metadata column to watchlist table', xbmc.LOGDEBUG)
-
-                # Migration: Add metas and catalogs tables if they don't exist (v3.2.0)
-                self.create_table('metas', self.METAS_SCHEMA)
-                self.create_table('catalogs', self.CATALOGS_SCHEMA)
-                self.commit()
+            if 'air_date' not in columns['episodes']:
+                steps.append("ALTER TABLE episodes ADD COLUMN air_date TEXT")
+                xbmc.log('[AIOStreams] Added air_date column to episodes table', xbmc.LOGDEBUG)
+
+            # Migration: Add metadata column to watchlist table
+            if 'metadata' not in columns['watchlist']:
+                steps.append("ALTER TABLE watchlist ADD COLUMN metadata BLOB")
+                xbmc.log('[AIOStreams] Added metadata column to watchlist table', xbmc.LOGDEBUG)
+
+            # Migration: metas and catalogs tables (v3.2.0) are created by _initialize_tables
+
+            # Migration: Denormalized clearlogo URL so the logo scan never decodes metadata
+            if 'logo_url' not in columns['metas']:
+                steps.append("ALTER TABLE metas ADD COLUMN logo_url TEXT")
+                xbmc.log('[AIOStreams] Added logo_url column to metas table', xbmc.LOGDEBUG)
+
+            # Covers content_type scans of metas (clearlogo check) without touching the metadata BLOBs
+            steps.append("DROP INDEX IF EXISTS idx_metas_ctype_id")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_metas_ctype_logo ON metas(content_type, id, logo_url)")
+
+            # Next Up lookups: watched episodes per show/season, and hidden progress items.
+            # air_date is carried in the index so the unwatched-and-aired scan never reads table rows.
+            steps.append("DROP INDEX IF EXISTS idx_episodes_show_watched")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_episodes_show_watched_aired ON episodes(show_trakt_id, watched, season, episode, air_date)")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_hidden_section_trakt ON hidden(section, trakt_id)")
+
+            # Newest-first listings of shows, movies and watchlist items
+            steps.append("CREATE INDEX IF NOT EXISTS idx_shows_last_updated ON shows(last_updated DESC)")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_movies_last_updated ON movies(last_updated DESC)")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_watchlist_mediatype_listed ON watchlist(mediatype, listed_at DESC)")
+
+            # Alternate-id terms of the Next Up bookmarks join (trakt_id is covered by UNIQUE(trakt_id, type))
+            steps.append("CREATE INDEX IF NOT EXISTS idx_bookmarks_tvdb ON bookmarks(tvdb_id) WHERE tvdb_id IS NOT NULL")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_bookmarks_tmdb ON bookmarks(tmdb_id) WHERE tmdb_id IS NOT NULL")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_bookmarks_imdb ON bookmarks(imdb_id) WHERE imdb_id IS NOT NULL")
+
+            # Expiry range scans for cleanup_cached_data
+            steps.append("CREATE INDEX IF NOT EXISTS idx_metas_expires ON metas(expires)")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_catalogs_expires ON catalogs(expires)")
+
+            # IMDB id lookups used while rendering lists (is_imdb_watched, are_imdb_watched, watchlist checks).
+            # Per-show episode checks are already served by idx_episodes_show_watched_aired, and bookmark
+            # lookups by UNIQUE(trakt_id, type) and the partial alternate-id indexes above.
+            steps.append("CREATE INDEX IF NOT EXISTS idx_shows_imdb ON shows(imdb_id)")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_movies_imdb_watched ON movies(imdb_id, watched)")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_episodes_imdb ON episodes(imdb_id) WHERE imdb_id IS NOT NULL")
+            steps.append("CREATE INDEX IF NOT EXISTS idx_watchlist_imdb ON watchlist(imdb_id, mediatype)")
+
+            # Refresh planner statistics for the new indexes
+            steps.append("ANALYZE")
+
+            # A failed step leaves user_version alone, so the next startup retries them all
+            for sql in steps:
+                if self.execute(sql) is None:
+                    xbmc.log(f'[AIOStreams] Migration step failed, schema left unchanged: {sql}', xbmc.LOGERROR)
+                    self.rollback()
+                    return False
+
+            if self.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}") is None or not self.commit():
+                self.rollback()
+                return False
+            xbmc.log(f'[AIOStreams] Trakt sync database schema at version {self.SCHEMA_VERSION}', xbmc.LOGDEBUG)
+            return True
 
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error running migrations: {e}', xbmc.LOGERROR)
+            self.rollback()
+            return False
+
+    def commit(self):
+        """Commit, dropping cached rows the transaction may have changed."""
+        with self._row_cache_lock:
+            self._row_cache.clear()
+        return super().commit()
+
+    def rollback(self):
+        """Roll back, dropping cached rows that may hold uncommitted data."""
+        with self._row_cache_lock:
+            self._row_cache.clear()
+        return super().rollback()
+
+    # Tables the Trakt sync writes; bulk_sync_context copies only these back to disk
+    SYNC_TABLES = ('activities', 'shows', 'episodes', 'movies', 'watchlist', 'bookmarks', 'hidden')
+
+    @contextmanager
+    def bulk_sync_context(self):
+        """
+        Run a bulk load against an in-memory copy of the database.
+
+        The on-disk database is copied into :memory: with the backup API and
+        self.connection is swapped to the copy, so every insert inside the block
+        hits RAM without journal or fsync work. On a clean exit the SYNC_TABLES
+        are copied back into the disk file in one transaction; the metas and
+        catalogs caches on disk are left alone, so rows the UI or service write
+        there meanwhile are kept. If the copy cannot be made the block runs
+        against the disk connection as usual; if the block raises, the in-memory
+        changes are discarded.
+
+        Writes made to the SYNC_TABLES by other processes while the block runs
+        are overwritten, so this is meant for the initial sync only.
+
+        Yields:
+            sqlite3.Connection: The connection the block should write through
+        """
+        connected = False
+        if not self.connection:
+            if not self.connect():
+                yield None
+                return
+            connected = True
+
+        disk = self.connection
+        memory = None
+        try:
+            if disk.in_transaction:
+                disk.commit()
+            page_size = disk.execute("PRAGMA page_size").fetchone()[0]
+            # Same lock timeout as Database.connect, for the write-back into the attached disk file
+            memory = sqlite3.connect(':memory:', timeout=10.0, check_same_thread=False)
+            memory.row_factory = sqlite3.Row
+            # Same temp_store as the disk connection (see Database.connect), so sorts stay off disk too
+            memory.execute("PRAGMA temp_store=MEMORY")
+            # Backups into an in-memory database require matching page sizes
+            memory.execute(f"PRAGMA page_size={int(page_size)}")
+            disk.backup(memory)
+        except sqlite3.Error as e:
+            xbmc.log(f'[AIOStreams] In-memory bulk sync unavailable, writing to disk: {e}', xbmc.LOGWARNING)
+            if memory is not None:
+                memory.close()
+            memory = None
+
+        if memory is None:
+            try:
+                yield disk
+            finally:
+                if connected:
+                    self.disconnect()
+            return
+
+        # data_version counters are per connection, so the saved one is dropped on each swap
+        with self._row_cache_lock:
+            self._row_cache.clear()
+            self._row_cache_version = None
+        self.connection = memory
+        try:
+            yield memory
+            try:
+                if memory.in_transaction:
+                    memory.commit()
+                memory.execute("ATTACH DATABASE ? AS disk", (self.db_path,))
+                memory.execute("BEGIN IMMEDIATE")
+                try:
+                    # Both copies share the schema (the memory one was backed up from disk), so * lines up
+                    for table in self.SYNC_TABLES:
+                        memory.execute(f"DELETE FROM disk.{table}")
+                        memory.execute(f"INSERT INTO disk.{table} SELECT * FROM main.{table}")
+                    memory.commit()
+                except sqlite3.Error:
+                    memory.rollback()
+                    raise
+                xbmc.log('[AIOStreams] Wrote in-memory bulk sync back to disk', xbmc.LOGDEBUG)
+            except sqlite3.Error as e:
+                xbmc.log(f'[AIOStreams] Error writing in-memory sync back to disk: {e}', xbmc.LOGERROR)
+        finally:
+            self.connection = disk
+            with self._row_cache_lock:
+                self._row_cache.clear()
+                self._row_cache_version = None
+            memory.close()
+            if connected:
+                self.disconnect()
+
+    def _get_cached_value(self, key, load):
+        """
+        Return the value cached under key in the per-connection LRU, calling
+        load() to compute and store it on a miss.
+
+        The cache is only used inside row_cache_batch(), which reads PRAGMA
+        data_version once on entry and empties the cache if another connection
+        (the service, another thread) has committed. Single lookups outside a
+        batch and lookups inside an open write transaction just call load().
+        The cache is also emptied whenever this connection commits or rolls
+        back. Values must not be mutated by callers; None is cached like any
+        other value.
+        """
+        # Rows written by this connection's open transaction are not cached
+        if not self._row_cache_batches or self.connection.in_transaction:
+            return load()
+
+        with self._row_cache_lock:
+            if key in self._row_cache:
+                self._row_cache.move_to_end(key)
+                return self._row_cache[key]
+
+        # Query without holding the lock; the value is stored afterwards
+        value = load()
+        with self._row_cache_lock:
+            self._row_cache[key] = value
+            if len(self._row_cache) > self.ROW_CACHE_SIZE:
+                self._row_cache.popitem(last=False)
+        return value
+
+    def _check_row_cache_version(self):
+        """Empty the row cache if another connection has committed since the last check.
+
+        Called with _row_cache_lock held.
+        """
+        row = self.fetch_one("PRAGMA data_version")
+        version = row[0] if row else None
+        if version != self._row_cache_version:
+            self._row_cache.clear()
+            self._row_cache_version = version
+
+    @contextmanager
+    def row_cache_batch(self):
+        """
+        Check PRAGMA data_version once for a whole listing and serve its repeated
+        lookups from the row cache.
+
+        Cached lookups are served only inside these blocks (see _get_cached_value).
+        They trust the version read on entry; a commit made by another connection
+        meanwhile is seen by the next batch. This connection's own commits still
+        empty the cache at once. Blocks may be nested.
+        """
+        if not self.connection and not self.connect():
+            yield self
+            return
+
+        with self._row_cache_lock:
+            if not self._row_cache_batches:
+                self._check_row_cache_version()
+            self._row_cache_batches += 1
+        try:
+            yield self
         finally:
-            self.disconnect()
+            with self._row_cache_lock:
+                self._row_cache_batches -= 1
+
+    def _get_cached_row(self, key, sql, params, unpack):
+        """
+        Fetch and unpack a single row through the per-connection LRU row cache.
 
-    def get_next_up_episodes(self):
+        Returns:
+            dict: Unpacked row, or None if not found
+        """
+        def load():
+            row = self.fetch_one(sql, params)
+            return unpack(row) if row else None
+
+        item = self._get_cached_value(key, load)
+        if item is None:
+            return None
+
+        # Callers assign into the returned dicts (e.g. show_meta['videos']); keep the cached copy intact
+        metadata = item['metadata']
+        return dict(item, metadata=dict(metadata) if isinstance(metadata, dict) else metadata)
+
+    def get_next_up_episodes(self, limit=None):
         """Get next unwatched episode for each show with watch history.
 
         Pure SQL calculation inspired by Seren - no API calls needed.
         Returns one episode per show that should be watched next.
 
+        Args:
+            limit: Optional maximum number of shows, most recently watched first
+
         Returns:
             list: List of dicts with show and episode data
         """
-        import datetime
-
-        now = datetime.datetime.utcnow().isoformat()
+        now = utc_now_iso()
 
-        query = f"""
-            WITH max_watched AS (
-                -- Find the maximum watched season and episode number for each show
-                SELECT
-                    show_trakt_id,
-                    MAX(season) as max_season,
-                    MAX(CASE WHEN season = (SELECT MAX(season) FROM episodes e2 WHERE e2.show_trakt_id = e.show_trakt_id AND e2.watched = 1)
-                        THEN episode ELSE 0 END) as max_episode,
-                    MAX(last_watched_at) as last_watched_at
-                FROM episodes e
-                WHERE watched = 1 AND season > 0
-                GROUP BY show_trakt_id
-            ),
-            next_episode_candidate AS (
-                -- Find the next unwatched episode after the last watched one
-                -- Uses ROW_NUMBER to correctly get the first episode by season+episode order
-                SELECT
-                    show_trakt_id,
-                    season as next_season,
-                    episode as next_episode
-                FROM (
-                    SELECT
-                        e.show_trakt_id,
-                        e.season,
-                        e.episode,
-                        ROW_NUMBER() OVER (PARTITION BY e.show_trakt_id ORDER BY e.season, e.episode) as rn
-                    FROM episodes e
-                    INNER JOIN max_watched mw ON e.show_trakt_id = mw.show_trakt_id
-                    WHERE e.season > 0
-                        AND e.watched = 0
-                        AND (
-                            -- Next episode in the same season
-                            (e.season = mw.max_season AND e.episode > mw.max_episode)
-                            -- OR first episode of next season
-                            OR (e.season > mw.max_season)
-                        )
-                        -- Only aired episodes
-                        AND datetime(e.air_date) < datetime('{now}')
-                )
-                WHERE rn = 1
-            )
-            SELECT
-                s.trakt_id as show_trakt_id,
-                s.imdb_id as show_imdb_id,
-                s.title as show_title,
-                e.trakt_id as episode_trakt_id,
-                e.season,
-                e.episode,
-                e.air_date,
-                e.imdb_id as episode_imdb_id,
-                e.metadata as episode_metadata,
-                mw.last_watched_at,
-                s.metadata as show_metadata,
-                b.percent_played,
-                b.resume_time
-            FROM next_episode_candidate nec
-            INNER JOIN episodes e
-                ON e.show_trakt_id = nec.show_trakt_id
-                AND e.season = nec.next_season
-                AND e.episode = nec.next_episode
-            INNER JOIN shows s ON s.trakt_id = e.show_trakt_id
-            INNER JOIN max_watched mw ON mw.show_trakt_id = e.show_trakt_id
-            LEFT JOIN bookmarks b ON (
-                (b.trakt_id = e.trakt_id OR 
-                 (b.tvdb_id IS NOT NULL AND b.tvdb_id = e.tvdb_id) OR 
-                 (b.tmdb_id IS NOT NULL AND b.tmdb_id = e.tmdb_id) OR 
-                 (b.imdb_id IS NOT NULL AND b.imdb_id = e.imdb_id))
-                AND b.type = 'episode'
-            )
-            WHERE e.show_trakt_id NOT IN (
-                SELECT trakt_id FROM hidden WHERE section = 'progress_watched'
-            )
-            ORDER BY mw.last_watched_at DESC
-        """
-
-        try:
+        connected = False
+        if not self.connection:
             if not self.connect():
                 return []
+            connected = True
 
-            cursor = self.execute(query)
+        try:
+            if limit:
+                cursor = self.execute(_NEXT_UP_LIMIT_SQL, (now, limit))
+            else:
+                cursor = self.execute(_NEXT_UP_SQL, (now,))
             if not cursor:
                 return []
 
-            results = []
-            for row in cursor.fetchall():
-                row_dict = dict(row)
-                # Unpickle show metadata
-                if row_dict.get('show_metadata'):
-                    try:
-                        row_dict['show_metadata'] = pickle.loads(row_dict['show_metadata'])
-                    except:
-                        row_dict['show_metadata'] = None
-                # Unpickle episode metadata
-                if row_dict.get('episode_metadata'):
+            # The column order is fixed by _NEXT_UP_SQL, so rows are unpacked positionally.
+            rows = cursor.fetchall()
+            loads = deserialize
+            try:
+                # Decode every metadata BLOB in one pass; a bad BLOB is rare enough that
+                # it is handled by re-decoding the batch row by row below
+                decoded = [(row[10] and loads(row[10]), row[8] and loads(row[8])) for row in rows]
+            except Exception as e:
+                xbmc.log(f'[AIOStreams] Undecodable Next Up metadata, skipping bad rows: {e}', xbmc.LOGWARNING)
+
+                def safe_loads(blob):
                     try:
-                        row_dict['episode_metadata'] = pickle.loads(row_dict['episode_metadata'])
-                    except:
-                        row_dict['episode_metadata'] = None
-                results.append(row_dict)
+                        return blob and loads(blob)
+                    except Exception:
+                        return None
+
+                decoded = [(safe_loads(row[10]), safe_loads(row[8])) for row in rows]
+
+            results = []
+            append = results.append
+            for (show_trakt_id, show_imdb_id, show_title, episode_trakt_id, season, episode, air_date,
+                 episode_imdb_id, _, last_watched_at, _, percent_played, resume_time), \
+                    (show_metadata, episode_metadata) in zip(rows, decoded):
+                append({
+                    'show_trakt_id': show_trakt_id,
+                    'show_imdb_id': show_imdb_id,
+                    'show_title': show_title,
+                    'episode_trakt_id': episode_trakt_id,
+                    'season': season,
+                    'episode': episode,
+                    'air_date': air_date,
+                    'episode_imdb_id': episode_imdb_id,
+                    'episode_metadata': episode_metadata,
+                    'last_watched_at': last_watched_at,
+                    'show_metadata': show_metadata,
+                    'percent_played': percent_played,
+                    'resume_time': resume_time,
+                })
 
-            self.disconnect()
             return results
 
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error getting next up episodes: {e}', xbmc.LOGERROR)
-            if self.connection:
-                self.disconnect()
             return []
+        finally:
+            if connected:
+                self.disconnect()
 
     def insert_show(self, trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, metadata, last_updated):
         """
-        Insert or replace a show in the database.
+        Insert a show, or update it in place if it already exists.
 
         Args:
             trakt_id: Trakt ID (primary key)
@@ -377,18 +940,113 @@ class TraktSyncDatabase(Database):
                 return False
 
         try:
-            pickled_metadata = pickle.dumps(metadata)
-            sql = """
-                INSERT OR REPLACE INTO shows 
-                (trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, metadata, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            self.execute(sql, (trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, pickled_metadata, last_updated))
+            pickled_metadata = serialize(metadata)
+            self.execute(self.INSERT_SHOW_SQL, (trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, pickled_metadata, last_updated))
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error inserting show {trakt_id}: {e}', xbmc.LOGERROR)
             return False
 
+    def insert_shows_bulk(self, rows):
+        """
+        Insert or update many shows in one transaction.
+
+        Args:
+            rows: Iterable of (trakt_id, imdb_id, tvdb_id, tmdb_id, slug, title, metadata, last_updated)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._insert_bulk(self.INSERT_SHOW_SQL, rows, 'shows')
+
+    def _insert_bulk(self, sql, rows, label):
+        """
+        Insert many rows with one prepared statement in a single transaction.
+
+        Args:
+            sql: INSERT statement; its second to last placeholder is the metadata BLOB
+            rows: Iterable of tuples in the same order as the single-row insert method
+                (metadata as a dict, serialized here)
+            label: Row type for log messages
+
+        Returns:
+            bool: True if the batch was committed, False otherwise
+        """
+        # A generator, so each metadata BLOB is serialized as SQLite consumes its
+        # row and released right after, rather than all of them held at once
+        params_iter = (tuple(row[:-2]) + (serialize(row[-2]), row[-1]) for row in rows)
+        return self._write_bulk(sql, params_iter, label)
+
+    def _write_bulk(self, sql, params_iter, label):
+        """
+        Run one prepared statement over many parameter tuples in a single transaction.
+
+        Args:
+            sql: Statement to run
+            params_iter: Iterable of parameter tuples, consumed lazily by executemany
+            label: Row type for log messages
+
+        Returns:
+            bool: True if the batch was committed, False otherwise
+        """
+        if not self.connection:
+            if not self.connect():
+                return False
+
+        try:
+            if not self.begin():
+                return False
+            if self.executemany(sql, params_iter) is None:
+                self.rollback()
+                return False
+            return self.commit()
+        except Exception as e:
+            xbmc.log(f'[AIOStreams] Error bulk inserting {label}: {e}', xbmc.LOGERROR)
+            self.rollback()
+            return False
+
+    def _write_values_bulk(self, prefix, width, params_iter, label):
+        """
+        Insert many rows using multi-row VALUES lists in a single transaction.
+
+        Each statement carries as many rows as fit in IN_CHUNK_SIZE parameters,
+        so SQLite steps one statement per chunk instead of one per row. Full
+        chunks always use the same SQL text and hit the prepared statement cache.
+
+        Args:
+            prefix: INSERT statement up to and including "VALUES "
+            width: Number of parameters per row
+            params_iter: Iterable of parameter tuples of length width
+            label: Row type for log messages
+
+        Returns:
+            bool: True if the batch was committed, False otherwise
+        """
+        if not self.connection:
+            if not self.connect():
+                return False
+
+        rows_per_chunk = max(1, self.IN_CHUNK_SIZE // width)
+        row_sql = '(' + ', '.join('?' * width) + ')'
+        chunk_sql = prefix + ', '.join([row_sql] * rows_per_chunk)
+        params_iter = iter(params_iter)
+        try:
+            if not self.begin():
+                return False
+            while True:
+                chunk = list(islice(params_iter, rows_per_chunk))
+                if not chunk:
+                    break
+                sql = chunk_sql if len(chunk) == rows_per_chunk else prefix + ', '.join([row_sql] * len(chunk))
+                if self.execute(sql, list(chain.from_iterable(chunk))) is None:
+                    self.rollback()
+                    return False
+            return self.commit()
+        except Exception as e:
+            xbmc.log(f'[AIOStreams] Error bulk inserting {label}: {e}', xbmc.LOGERROR)
+            self.rollback()
+            return False
+
     def get_show(self, trakt_id):
         """
         Retrieve a show by Trakt ID.
@@ -405,23 +1063,22 @@ class TraktSyncDatabase(Database):
 
         try:
             if isinstance(trakt_id, str) and trakt_id.startswith('tt'):
-                sql = "SELECT * FROM shows WHERE imdb_id = ?"
+                sql = self.GET_SHOW_BY_IMDB_SQL
             else:
-                sql = "SELECT * FROM shows WHERE trakt_id = ?"
-            row = self.fetch_one(sql, (trakt_id,))
-            if row:
-                return self._unpack_show_row(row)
-            return None
+                sql = self.GET_SHOW_BY_TRAKT_SQL
+            return self._get_cached_row(('show', trakt_id), sql, (trakt_id,), self._unpack_show_row)
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error retrieving show {trakt_id}: {e}', xbmc.LOGERROR)
             return None
 
-    def get_shows(self, limit=None):
+    def get_shows(self, limit=None, with_metadata=True):
         """
         Retrieve all shows or a limited number.
 
         Args:
             limit: Optional maximum number of shows to retrieve
+            with_metadata: If False, skip the metadata BLOB and return only the
+                id, slug, title and last_updated columns (for menus and id lookups)
 
         Returns:
             list: List of show dictionaries with unpickled metadata
@@ -431,20 +1088,24 @@ class TraktSyncDatabase(Database):
                 return []
 
         try:
-            sql = "SELECT * FROM shows ORDER BY last_updated DESC"
+            sql = self.GET_SHOWS_SQL if with_metadata else self.GET_SHOWS_BRIEF_SQL
             params = None
             if limit:
                 sql += " LIMIT ?"
                 params = (limit,)
-            rows = self.fetch_all(sql, params)
-            return [self._unpack_show_row(row) for row in rows]
+            cursor = self.execute(sql, params)
+            if not cursor:
+                return []
+            if not with_metadata:
+                return [dict(row) for row in cursor]
+            return [self._unpack_show_row(row) for row in cursor.fetchall()]
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error retrieving shows: {e}', xbmc.LOGERROR)
             return []
 
     def insert_episode(self, show_trakt_id, season, episode, trakt_id, imdb_id, tmdb_id, tvdb_id, metadata, last_updated):
         """
-        Insert or replace an episode in the database.
+        Insert an episode, or update it in place if it already exists.
 
         Args:
             show_trakt_id: Trakt ID of the parent show
@@ -465,18 +1126,26 @@ class TraktSyncDatabase(Database):
                 return False
 
         try:
-            pickled_metadata = pickle.dumps(metadata)
-            sql = """
-                INSERT OR REPLACE INTO episodes 
-                (show_trakt_id, season, episode, trakt_id, imdb_id, tmdb_id, tvdb_id, metadata, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            self.execute(sql, (show_trakt_id, season, episode, trakt_id, imdb_id, tmdb_id, tvdb_id, pickled_metadata, last_updated))
+            pickled_metadata = serialize(metadata)
+            self.execute(self.INSERT_EPISODE_SQL, (show_trakt_id, season, episode, trakt_id, imdb_id, tmdb_id, tvdb_id, pickled_metadata, last_updated))
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error inserting episode {show_trakt_id} S{season}E{episode}: {e}', xbmc.LOGERROR)
             return False
 
+    def insert_episodes_bulk(self, rows):
+        """
+        Insert or update many episodes in one transaction.
+
+        Args:
+            rows: Iterable of (show_trakt_id, season, episode, trakt_id, imdb_id, tmdb_id,
+                tvdb_id, metadata, last_updated)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._insert_bulk(self.INSERT_EPISODE_SQL, rows, 'episodes')
+
     def get_episode(self, show_trakt_id, season, episode):
         """
         Retrieve an episode by show ID, season, and episode number.
@@ -494,11 +1163,8 @@ class TraktSyncDatabase(Database):
                 return None
 
         try:
-            sql = "SELECT * FROM episodes WHERE show_trakt_id = ? AND season = ? AND episode = ?"
-            row = self.fetch_one(sql, (show_trakt_id, season, episode))
-            if row:
-                return self._unpack_episode_row(row)
-            return None
+            params = (show_trakt_id, season, episode)
+            return self._get_cached_row(('episode',) + params, self.GET_EPISODE_SQL, params, self._unpack_episode_row)
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error retrieving episode {show_trakt_id} S{season}E{episode}: {e}', xbmc.LOGERROR)
             return None
@@ -518,16 +1184,16 @@ class TraktSyncDatabase(Database):
                 return []
 
         try:
-            sql = "SELECT * FROM episodes WHERE show_trakt_id = ? ORDER BY season, episode"
-            rows = self.fetch_all(sql, (show_trakt_id,))
-            return [self._unpack_episode_row(row) for row in rows]
+            sql = self.GET_SHOW_EPISODES_SQL
+            cursor = self.execute(sql, (show_trakt_id,))
+            return [self._unpack_episode_row(row) for row in cursor.fetchall()] if cursor else []
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error retrieving episodes for show {show_trakt_id}: {e}', xbmc.LOGERROR)
             return []
 
     def insert_movie(self, trakt_id, imdb_id, tmdb_id, slug, title, metadata, last_updated):
         """
-        Insert or replace a movie in the database.
+        Insert a movie, or update it in place if it already exists.
 
         Args:
             trakt_id: Trakt ID (primary key)
@@ -546,18 +1212,25 @@ class TraktSyncDatabase(Database):
                 return False
 
         try:
-            pickled_metadata = pickle.dumps(metadata)
-            sql = """
-                INSERT OR REPLACE INTO movies 
-                (trakt_id, imdb_id, tmdb_id, slug, title, metadata, last_updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            self.execute(sql, (trakt_id, imdb_id, tmdb_id, slug, title, pickled_metadata, last_updated))
+            pickled_metadata = serialize(metadata)
+            self.execute(self.INSERT_MOVIE_SQL, (trakt_id, imdb_id, tmdb_id, slug, title, pickled_metadata, last_updated))
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error inserting movie {trakt_id}: {e}', xbmc.LOGERROR)
             return False
 
+    def insert_movies_bulk(self, rows):
+        """
+        Insert or update many movies in one transaction.
+
+        Args:
+            rows: Iterable of (trakt_id, imdb_id, tmdb_id, slug, title, metadata, last_updated)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._insert_bulk(self.INSERT_MOVIE_SQL, rows, 'movies')
+
     def get_movie(self, trakt_id):
         """
         Retrieve a movie by Trakt ID.
@@ -574,23 +1247,22 @@ class TraktSyncDatabase(Database):
 
         try:
             if isinstance(trakt_id, str) and trakt_id.startswith('tt'):
-                sql = "SELECT * FROM movies WHERE imdb_id = ?"
+                sql = self.GET_MOVIE_BY_IMDB_SQL
             else:
-                sql = "SELECT * FROM movies WHERE trakt_id = ?"
-            row = self.fetch_one(sql, (trakt_id,))
-            if row:
-                return self._unpack_movie_row(row)
-            return None
+                sql = self.GET_MOVIE_BY_TRAKT_SQL
+            return self._get_cached_row(('movie', trakt_id), sql, (trakt_id,), self._unpack_movie_row)
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error retrieving movie {trakt_id}: {e}', xbmc.LOGERROR)
             return None
 
-    def get_movies(self, limit=None):
+    def get_movies(self, limit=None, with_metadata=True):
         """
         Retrieve all movies or a limited number.
 
         Args:
             limit: Optional maximum number of movies to retrieve
+            with_metadata: If False, skip the metadata BLOB and return only the
+                id, slug, title and last_updated columns (for menus and id lookups)
 
         Returns:
             list: List of movie dictionaries with unpickled metadata
@@ -600,20 +1272,24 @@ class TraktSyncDatabase(Database):
                 return []
 
         try:
-            sql = "SELECT * FROM movies ORDER BY last_updated DESC"
+            sql = self.GET_MOVIES_SQL if with_metadata else self.GET_MOVIES_BRIEF_SQL
             params = None
             if limit:
                 sql += " LIMIT ?"
                 params = (limit,)
-            rows = self.fetch_all(sql, params)
-            return [self._unpack_movie_row(row) for row in rows]
+            cursor = self.execute(sql, params)
+            if not cursor:
+                return []
+            if not with_metadata:
+                return [dict(row) for row in cursor]
+            return [self._unpack_movie_row(row) for row in cursor.fetchall()]
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error retrieving movies: {e}', xbmc.LOGERROR)
             return []
 
     def insert_watchlist_item(self, content_type, trakt_id, listed_at, metadata, last_updated):
         """
-        Insert or replace a watchlist item in the database.
+        Insert a watchlist item, or update it in place if it already exists.
 
         Args:
             content_type: Type of content ('show' or 'movie')
@@ -630,18 +1306,25 @@ class TraktSyncDatabase(Database):
                 return False
 
         try:
-            pickled_metadata = pickle.dumps(metadata)
-            sql = """
-                INSERT OR REPLACE INTO watchlist 
-                (content_type, trakt_id, listed_at, metadata, last_updated)
-                VALUES (?, ?, ?, ?, ?)
-            """
-            self.execute(sql, (content_type, trakt_id, listed_at, pickled_metadata, last_updated))
+            pickled_metadata = serialize(metadata)
+            self.execute(self.INSERT_WATCHLIST_SQL, (content_type, trakt_id, listed_at, pickled_metadata, last_updated))
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error inserting watchlist item {content_type}/{trakt_id}: {e}', xbmc.LOGERROR)
             return False
 
+    def insert_watchlist_items_bulk(self, rows):
+        """
+        Insert or update many watchlist items in one transaction.
+
+        Args:
+            rows: Iterable of (content_type, trakt_id, listed_at, metadata, last_updated)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self._insert_bulk(self.INSERT_WATCHLIST_SQL, rows, 'watchlist items')
+
     def get_watchlist_items(self, content_type=None):
         """
         Retrieve watchlist items, optionally filtered by content type.
@@ -658,12 +1341,12 @@ class TraktSyncDatabase(Database):
 
         try:
             if content_type:
-                sql = "SELECT * FROM watchlist WHERE mediatype = ? ORDER BY listed_at DESC"
-                rows = self.fetch_all(sql, (content_type,))
+                sql = self.GET_WATCHLIST_BY_TYPE_SQL
+                cursor = self.execute(sql, (content_type,))
             else:
-                sql = "SELECT * FROM watchlist ORDER BY listed_at DESC"
-                rows = self.fetch_all(sql)
-            return [self._unpack_watchlist_row(row) for row in rows]
+                sql = self.GET_WATCHLIST_SQL
+                cursor = self.execute(sql)
+            return [self._unpack_watchlist_row(row) for row in cursor.fetchall()] if cursor else []
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error retrieving watchlist items: {e}', xbmc.LOGERROR)
             return []
@@ -686,8 +1369,11 @@ class TraktSyncDatabase(Database):
         elif mediatype == 'movies':
             mediatype = 'movie'
 
-        if not self.connect():
-            return False
+        connected = False
+        if not self.connection:
+            if not self.connect():
+                return False
+            connected = True
 
         try:
             sql = """
@@ -702,72 +1388,48 @@ class TraktSyncDatabase(Database):
             xbmc.log(f'[AIOStreams] Error adding hidden item {trakt_id}: {e}', xbmc.LOGERROR)
             return False
         finally:
-            self.disconnect()
+            if connected:
+                self.disconnect()
 
     def _unpack_show_row(self, row):
-        """Unpack a show database row, deserializing the metadata BLOB."""
+        """Unpack a show row selected with SHOW_COLUMNS, deserializing the metadata BLOB."""
         try:
-            return {
-                'trakt_id': row['trakt_id'],
-                'imdb_id': row['imdb_id'],
-                'tvdb_id': row['tvdb_id'],
-                'tmdb_id': row['tmdb_id'],
-                'slug': row['slug'],
-                'title': row['title'],
-                'metadata': pickle.loads(row['metadata']) if row['metadata'] else {},
-                'last_updated': row['last_updated']
-            }
+            item = dict(zip(self.SHOW_FIELDS, row))
+            metadata = item['metadata']
+            item['metadata'] = deserialize(metadata) if metadata else {}
+            return item
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error unpacking show row: {e}', xbmc.LOGERROR)
             return None
 
     def _unpack_episode_row(self, row):
-        """Unpack an episode database row, deserializing the metadata BLOB."""
+        """Unpack an episode row selected with EPISODE_COLUMNS, deserializing the metadata BLOB."""
         try:
-            return {
-                'id': row['id'],
-                'show_trakt_id': row['show_trakt_id'],
-                'season': row['season'],
-                'episode': row['episode'],
-                'trakt_id': row['trakt_id'],
-                'imdb_id': row['imdb_id'],
-                'tmdb_id': row['tmdb_id'],
-                'tvdb_id': row['tvdb_id'],
-                'metadata': pickle.loads(row['metadata']) if row['metadata'] else {},
-                'last_updated': row['last_updated']
-            }
+            item = dict(zip(self.EPISODE_FIELDS, row))
+            metadata = item['metadata']
+            item['metadata'] = deserialize(metadata) if metadata else {}
+            return item
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error unpacking episode row: {e}', xbmc.LOGERROR)
             return None
 
     def _unpack_movie_row(self, row):
-        """Unpack a movie database row, deserializing the metadata BLOB."""
+        """Unpack a movie row selected with MOVIE_COLUMNS, deserializing the metadata BLOB."""
         try:
-            return {
-                'trakt_id': row['trakt_id'],
-                'imdb_id': row['imdb_id'],
-                'tmdb_id': row['tmdb_id'],
-                'slug': row['slug'],
-                'title': row['title'],
-                'metadata': pickle.loads(row['metadata']),
-                'last_updated': row['last_updated']
-            }
+            item = dict(zip(self.MOVIE_FIELDS, row))
+            item['metadata'] = deserialize(item['metadata'])
+            return item
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error unpacking movie row: {e}', xbmc.LOGERROR)
             return None
 
     def _unpack_watchlist_row(self, row):
-        """Unpack a watchlist database row, deserializing the metadata BLOB."""
+        """Unpack a watchlist row selected with WATCHLIST_COLUMNS, deserializing the metadata BLOB."""
         try:
-            return {
-                'id': row['id'],
-                'trakt_id': row['trakt_id'],
-                'mediatype': row['mediatype'],
-                'imdb_id': row['imdb_id'],
-                'listed_at': row['listed_at'],
-                'last_updated': row['last_updated'],
-                'metadata': pickle.loads(row['metadata']) if ('metadata' in row.keys() and row['metadata']) else None
-            }
+            item = dict(zip(self.WATCHLIST_FIELDS, row))
+            metadata = item['metadata']
+            item['metadata'] = deserialize(metadata) if metadata else None
+            return item
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error unpacking watchlist row: {e}', xbmc.LOGERROR)
             return None
@@ -819,6 +1481,8 @@ class TraktSyncDatabase(Database):
             connected = True
         
         try:
+            if not self.begin():
+                return False
             cursor = self.executemany(sql, params_list)
             if cursor is not None:
                 self.commit()
@@ -849,24 +1513,30 @@ class TraktSyncDatabase(Database):
             connected = True
         
         try:
-            row = self.fetch_one(sql, params)
-            if row:
-                # Convert sqlite3.Row to dict
-                return dict(row)
-            return None
+            # Straight to the connection: this is the hot path for single-row lookups
+            try:
+                row = self.connection.execute(sql, params or ()).fetchone()
+            except sqlite3.Error as e:
+                xbmc.log(f'[AIOStreams] SQL execution error: {e}', xbmc.LOGERROR)
+                return None
+            # Convert sqlite3.Row to dict
+            return dict(row) if row else None
         finally:
             if connected:
                 self.disconnect()
 
-    def fetchall(self, sql, params=None):
+    def fetchall(self, sql, params=None, columnar=False):
         """Fetch all rows with connection management.
         
         Args:
             sql: SQL query
             params: Optional tuple of parameters
+            columnar: If True, return one list per column instead of one dict per row
+                (no per-row dict allocations, for large scans read column-wise)
         
         Returns:
-            list: List of rows as dictionaries
+            list: List of rows as dictionaries, or
+            dict: {column name: list of values} when columnar is True (empty dict on error)
         """
         connected = False
         if not self.connection:
@@ -875,10 +1545,23 @@ class TraktSyncDatabase(Database):
             connected = True
         
         try:
-            rows = self.fetch_all(sql, params)
-            
-            # Debug: Check if JOIN is working and if percent_played is populated
-            if rows:
+            try:
+                cursor = self.connection.execute(sql, params or ())
+            except sqlite3.Error as e:
+                xbmc.log(f'[AIOStreams] SQL execution error: {e}', xbmc.LOGERROR)
+                return {} if columnar else []
+
+            if columnar:
+                names = [column[0] for column in cursor.description]
+                values = list(zip(*cursor.fetchall())) or [()] * len(names)
+                return {name: list(column) for name, column in zip(names, values)}
+
+            # Convert sqlite3.Row objects to dicts
+            rows = [dict(row) for row in cursor]
+
+            # Debug: Check if JOIN is working and if percent_played is populated.
+            # Only when debug logging is on: the bookmark check below scans the whole table.
+            if rows and debug_logging_enabled():
                 xbmc.log(f'[AIOStreams] fetchall: Retrieved {len(rows)} results for query: {sql}', xbmc.LOGDEBUG)
                 # Check first result for bookmark data if relevant columns exist
                 first = rows[0]
@@ -896,10 +1579,41 @@ class TraktSyncDatabase(Database):
                     all_bookmarks = self.fetch_all("SELECT trakt_id, tvdb_id, tmdb_id, imdb_id, percent_played FROM bookmarks WHERE type='episode'")
                     xbmc.log(f'[AIOStreams] Total episode bookmarks in DB: {len(all_bookmarks) if all_bookmarks else 0}', xbmc.LOGDEBUG)
                     if all_bookmarks and len(all_bookmarks) > 0:
-                        xbmc.log(f'[AIOStreams] Sample bookmark: {all_bookmarks[0]}', xbmc.LOGDEBUG)
-            
-            # Convert sqlite3.Row objects to dicts
-            return [dict(row) for row in rows]
+                        xbmc.log(f'[AIOStreams] Sample bookmark: {dict(all_bookmarks[0])}', xbmc.LOGDEBUG)
+
+            return rows
+        finally:
+            if connected:
+                self.disconnect()
+
+    def iter_rows(self, sql, params=None):
+        """Yield rows one at a time as dictionaries, with connection management.
+
+        For large scans consumed in a single pass: only the current row is held in
+        memory instead of the whole result list fetchall() builds.
+
+        Args:
+            sql: SQL query
+            params: Optional tuple of parameters
+
+        Yields:
+            dict: Each row as a dictionary
+        """
+        connected = False
+        if not self.connection:
+            if not self.connect():
+                return
+            connected = True
+
+        try:
+            try:
+                cursor = self.connection.execute(sql, params or ())
+            except sqlite3.Error as e:
+                xbmc.log(f'[AIOStreams] SQL execution error: {e}', xbmc.LOGERROR)
+                return
+            names = [column[0] for column in cursor.description]
+            for row in cursor:
+                yield dict(zip(names, row))
         finally:
             if connected:
                 self.disconnect()
@@ -909,24 +1623,38 @@ class TraktSyncDatabase(Database):
         if not self.connection and not self.connect():
             return None
         try:
-            sql = "SELECT metadata FROM metas WHERE id=? AND content_type=? AND expires > ?"
-            row = self.fetch_one(sql, (meta_id, content_type, int(time.time())))
-            if row and row['metadata']:
-                return pickle.loads(row['metadata'])
+            sql = "SELECT metadata, expires FROM metas WHERE id=? AND content_type=?"
+            params = (meta_id, content_type)
+            # The BLOB is cached, not the decoded dict, so every caller gets its own copy to modify
+            row = self._get_cached_value(('meta',) + params, lambda: self.fetch_one(sql, params))
+            if row and row['metadata'] and (row['expires'] or 0) > int(time.time()):
+                return deserialize(row['metadata'])
             return None
         except Exception as e:
             xbmc.log(f'[AIOStreams] DB error getting meta: {e}', xbmc.LOGWARNING)
             return None
 
+    @staticmethod
+    def _meta_params(content_type, meta_id, metadata, ttl_seconds, now):
+        """Build the SET_META_SQL parameters for one metadata entry."""
+        # '' (not NULL) records that the metadata has no logo
+        logo_url = ((metadata or {}).get('meta') or {}).get('logo') or ''
+        return (meta_id, content_type, serialize_json(metadata), now + ttl_seconds, logo_url)
+
+    @staticmethod
+    def _catalog_params(content_type, catalog_id, genre, skip, data, ttl_seconds, now):
+        """Build the SET_CATALOG_SQL parameters for one catalog page."""
+        # Use unique key for catalogs: content_type:catalog_id:genre:skip
+        cache_id = f"{content_type}:{catalog_id}:{genre or 'none'}:{skip}"
+        return (cache_id, content_type, catalog_id, genre, skip, serialize_json(data), now + ttl_seconds)
+
     def set_meta(self, content_type, meta_id, metadata, ttl_seconds):
         """Store metadata in the SQL cache."""
         if not self.connection and not self.connect():
             return False
         try:
-            expires = int(time.time()) + ttl_seconds
-            pickled_metadata = pickle.dumps(metadata)
-            sql = "INSERT OR REPLACE INTO metas (id, content_type, metadata, expires) VALUES (?, ?, ?, ?)"
-            self.execute(sql, (meta_id, content_type, pickled_metadata, expires))
+            params = self._meta_params(content_type, meta_id, metadata, ttl_seconds, int(time.time()))
+            self.execute(self.SET_META_SQL, params)
             self.commit()
             return True
         except Exception as e:
@@ -938,10 +1666,11 @@ class TraktSyncDatabase(Database):
         if not self.connection and not self.connect():
             return None
         try:
-            sql = "SELECT data FROM catalogs WHERE catalog_id=? AND content_type=? AND (genre=? OR (genre IS NULL AND ? IS NULL)) AND skip=? AND expires > ?"
-            row = self.fetch_one(sql, (catalog_id, content_type, genre, genre, skip, int(time.time())))
-            if row and row['data']:
-                return pickle.loads(row['data'])
+            sql = "SELECT data, expires FROM catalogs WHERE catalog_id=? AND content_type=? AND (genre=? OR (genre IS NULL AND ? IS NULL)) AND skip=?"
+            params = (catalog_id, content_type, genre, genre, skip)
+            row = self._get_cached_value(('catalog',) + params, lambda: self.fetch_one(sql, params))
+            if row and row['data'] and (row['expires'] or 0) > int(time.time()):
+                return deserialize(row['data'])
             return None
         except Exception as e:
             xbmc.log(f'[AIOStreams] DB error getting catalog: {e}', xbmc.LOGWARNING)
@@ -952,25 +1681,61 @@ class TraktSyncDatabase(Database):
         if not self.connection and not self.connect():
             return False
         try:
-            expires = int(time.time()) + ttl_seconds
-            pickled_data = pickle.dumps(data)
-            # Use unique key for catalogs: content_type:catalog_id:genre:skip
-            cache_id = f"{content_type}:{catalog_id}:{genre or 'none'}:{skip}"
-            sql = "INSERT OR REPLACE INTO catalogs (id, content_type, catalog_id, genre, skip, data, expires) VALUES (?, ?, ?, ?, ?, ?, ?)"
-            self.execute(sql, (cache_id, content_type, catalog_id, genre, skip, pickled_data, expires))
+            params = self._catalog_params(content_type, catalog_id, genre, skip, data, ttl_seconds, int(time.time()))
+            self.execute(self.SET_CATALOG_SQL, params)
             self.commit()
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] DB error setting catalog: {e}', xbmc.LOGWARNING)
             return False
 
+    def set_metas_bulk(self, rows):
+        """
+        Store many metadata entries in the SQL cache in one transaction.
+
+        Args:
+            rows: Iterable of (content_type, meta_id, metadata, ttl_seconds)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        now = int(time.time())
+        params_iter = (self._meta_params(*row, now) for row in rows)
+        return self._write_values_bulk(self.SET_META_PREFIX, 5, params_iter, 'metas')
+
+    def set_catalogs_bulk(self, rows):
+        """
+        Store many catalog pages in the SQL cache in one transaction.
+
+        Args:
+            rows: Iterable of (content_type, catalog_id, genre, skip, data, ttl_seconds)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        now = int(time.time())
+        params_iter = (self._catalog_params(*row, now) for row in rows)
+        return self._write_values_bulk(self.SET_CATALOG_PREFIX, 7, params_iter, 'catalogs')
+
     def cleanup_cached_data(self):
         """Remove expired metadata and catalog entries from the database."""
         if not self.connection and not self.connect():
             return False
         try:
             now = int(time.time())
-            
+
+            # Usually nothing has expired; skip the write transaction and its fsync entirely
+            row = self.fetch_one(
+                "SELECT EXISTS(SELECT 1 FROM metas WHERE expires < ?) OR EXISTS(SELECT 1 FROM catalogs WHERE expires < ?)",
+                (now, now)
+            )
+            if not row or not row[0]:
+                return True
+
+            # Both deletes share one transaction, so the WAL is synced once
+            if not self.begin():
+                return False
+
             # Delete expired metas
             cursor_meta = self.execute("DELETE FROM metas WHERE expires < ?", (now,))
             meta_count = cursor_meta.rowcount if cursor_meta else 0
@@ -979,23 +1744,25 @@ class TraktSyncDatabase(Database):
             cursor_catalog = self.execute("DELETE FROM catalogs WHERE expires < ?", (now,))
             catalog_count = cursor_catalog.rowcount if cursor_catalog else 0
             
-            self.commit()
+            if not self.commit():
+                self.rollback()
+                return False
             
             if meta_count > 0 or catalog_count > 0:
                 xbmc.log(f'[AIOStreams] SQL Cache cleanup: removed {meta_count} metas and {catalog_count} catalogs', xbmc.LOGDEBUG)
             return True
         except Exception as e:
             xbmc.log(f'[AIOStreams] DB error during cache cleanup: {e}', xbmc.LOGWARNING)
+            self.rollback()
             return False
+
     def get_trakt_id_for_item(self, imdb_id, mediatype):
         """Retrieve Trakt ID for an item by its IMDB ID."""
         if not self.connection and not self.connect():
             return None
         try:
-            table = 'movies' if mediatype == 'movie' else 'shows'
-            sql = f"SELECT trakt_id FROM {table} WHERE imdb_id = ?"
-            # Use safe wrapper that handles connection/disconnection
-            row = self.fetchone(sql, (imdb_id,))
+            sql = self.GET_MOVIE_TRAKT_ID_SQL if mediatype == 'movie' else self.GET_SHOW_TRAKT_ID_SQL
+            row = self._get_cached_value(('trakt_id', sql, imdb_id), lambda: self.fetch_one(sql, (imdb_id,)))
             return row['trakt_id'] if row else None
         except Exception as e:
             xbmc.log(f'[AIOStreams] DB error getting trakt_id: {e}', xbmc.LOGWARNING)
@@ -1006,35 +1773,35 @@ class TraktSyncDatabase(Database):
         if not self.connection and not self.connect():
             return None
         try:
-            # Try matching on any available ID
-            sql_parts = []
-            params = []
-            
-            if trakt_id:
-                sql_parts.append("trakt_id = ?")
-                params.append(trakt_id)
-            if tvdb_id:
-                sql_parts.append("tvdb_id = ?")
-                params.append(tvdb_id)
-            if tmdb_id:
-                sql_parts.append("tmdb_id = ?")
-                params.append(tmdb_id)
-            if imdb_id:
-                sql_parts.append("imdb_id = ?")
-                params.append(imdb_id)
-            
-            if not sql_parts:
+            # Try matching on any available ID, in priority order. Each id gets its own
+            # indexed lookup (an OR across columns can't use one index); UNION ALL runs
+            # the branches in order and LIMIT 1 stops at the first match.
+            lookups = [
+                (sql, value) for sql, value in (
+                    (self.GET_BOOKMARK_BY_TRAKT_SQL, trakt_id),
+                    (self.GET_BOOKMARK_BY_TVDB_SQL, tvdb_id),
+                    (self.GET_BOOKMARK_BY_TMDB_SQL, tmdb_id),
+                    (self.GET_BOOKMARK_BY_IMDB_SQL, imdb_id),
+                ) if value
+            ]
+
+            if not lookups:
                 return None
-            
-            sql = f"SELECT resume_time, percent_played FROM bookmarks WHERE ({' OR '.join(sql_parts)})"
+
+            # The usual caller passes a single id: query it directly with the
+            # prebuilt statement instead of assembling a one-branch UNION
+            if len(lookups) == 1:
+                sql, value = lookups[0]
+                return self.fetchone(sql, (value,))
+
+            sql = ' UNION ALL '.join(sql for sql, _ in lookups) + ' LIMIT 1'
+            params = [value for _, value in lookups]
             # Use safe wrapper that handles connection/disconnection
             return self.fetchone(sql, tuple(params))
         except Exception as e:
             xbmc.log(f'[AIOStreams] DB error getting bookmark: {e}', xbmc.LOGWARNING)
             return None
 
-    def is_item_watched(self, trakt_id, mediatype, season=None, episode=None):
-        """Check if an item is marked as watched."""
     def is_item_watched(self, trakt_id, mediatype, season=None, episode=None):
         """Check if an item is marked as watched."""
         if not self.connection and not self.connect():
@@ -1058,15 +1825,11 @@ class TraktSyncDatabase(Database):
                 return bool(row and row['watched_episodes'] > 0 and row['unwatched_episodes'] == 0)
             elif mediatype == 'season':
                 if season == 0: return False # Specials are optional
-                # Check episodes for this specific season
-                sql = "SELECT COUNT(*) as unwatched FROM episodes WHERE show_trakt_id = ? AND season = ? AND watched = 0"
-                row = self.fetchone(sql, (trakt_id, season))
-                if not row or row['unwatched'] > 0:
-                    return False
-                # Ensure there's actually at least one watched episode (to avoid empty seasons)
-                sql = "SELECT COUNT(*) as watched FROM episodes WHERE show_trakt_id = ? AND season = ? AND watched = 1"
+                # Count unwatched and watched episodes of this season in one pass
+                sql = "SELECT SUM(watched = 0) as unwatched, SUM(watched = 1) as watched FROM episodes WHERE show_trakt_id = ? AND season = ?"
                 row = self.fetchone(sql, (trakt_id, season))
-                return bool(row and row['watched'] > 0)
+                # Needs no unwatched episodes and at least one watched one (empty seasons sum to NULL)
+                return bool(row and row['unwatched'] == 0 and row['watched'])
             return False
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error checking IMDb watched status: {e}', xbmc.LOGERROR)
@@ -1083,53 +1846,103 @@ class TraktSyncDatabase(Database):
                 if not self.connect():
                     return False
 
-            if mediatype == 'movie':
-                # Check movies table
-                # Use safe wrapper that handles connection/disconnection
-                row = self.fetchone("SELECT watched FROM movies WHERE imdb_id = ?", (imdb_id,))
-                is_watched = bool(row and row['watched'])
-                # xbmc.log(f'[AIOStreams] DB Check Movie {imdb_id}: {is_watched}', xbmc.LOGDEBUG)
-                return is_watched
-                
-            elif mediatype in ['show', 'series', 'tvshow']:
-                # For shows, we need to check if all aired episodes are watched
-                # First get the show's Trakt ID
-                row = self.fetchone("SELECT trakt_id FROM shows WHERE imdb_id = ?", (imdb_id,))
-                if not row:
-                    # xbmc.log(f'[AIOStreams] DB Check Show {imdb_id}: Show not found in DB', xbmc.LOGDEBUG)
-                    return False
-                
-                trakt_id = row['trakt_id']
-                
-                # Count total and watched episodes
-                stats = self.fetchone("""
-                    SELECT 
-                        COUNT(*) as total,
-                        SUM(CASE WHEN watched = 1 THEN 1 ELSE 0 END) as watched_count
-                    FROM episodes 
-                    WHERE show_trakt_id = ? AND air_date <= datetime('now')
-                """, (trakt_id,))
-                
-                if not stats or stats['total'] == 0:
-                    # xbmc.log(f'[AIOStreams] DB Check Show {imdb_id}: No episodes found', xbmc.LOGDEBUG)
-                    return False
-                    
-                is_watched = stats['watched_count'] >= stats['total']
-                # xbmc.log(f'[AIOStreams] DB Check Show {imdb_id}: {stats["watched_count"]}/{stats["total"]} episodes watched -> {is_watched}', xbmc.LOGDEBUG)
-                return is_watched
-                
-            elif mediatype == 'episode':
-                # Check specific episode
-                row = self.fetchone("SELECT watched FROM episodes WHERE imdb_id = ?", (imdb_id,))
-                is_watched = bool(row and row['watched'])
-                # xbmc.log(f'[AIOStreams] DB Check Episode {imdb_id}: {is_watched}', xbmc.LOGDEBUG)
-                return is_watched
-                
-            return False
+            return self._get_cached_value(
+                ('imdb_watched', mediatype, imdb_id),
+                lambda: self._query_imdb_watched(imdb_id, mediatype)
+            )
         except Exception as e:
             xbmc.log(f'[AIOStreams] Error checking IMDb watched status: {e}', xbmc.LOGERROR)
             return False
 
+    def _query_imdb_watched(self, imdb_id, mediatype):
+        """Uncached body of is_imdb_watched."""
+        if mediatype == 'movie':
+            # Check movies table
+            # Use safe wrapper that handles connection/disconnection
+            row = self.fetchone("SELECT watched FROM movies WHERE imdb_id = ?", (imdb_id,))
+            is_watched = bool(row and row['watched'])
+            # xbmc.log(f'[AIOStreams] DB Check Movie {imdb_id}: {is_watched}', xbmc.LOGDEBUG)
+            return is_watched
+            
+        elif mediatype in ['show', 'series', 'tvshow']:
+            # For shows, we need to check if all aired episodes are watched
+            stats = self.fetchone(self.GET_IMDB_SHOW_PROGRESS_SQL, (utc_now_iso(), imdb_id))
+            
+            if not stats or stats['total'] == 0:
+                # xbmc.log(f'[AIOStreams] DB Check Show {imdb_id}: No episodes found', xbmc.LOGDEBUG)
+                return False
+                
+            is_watched = stats['watched_count'] >= stats['total']
+            # xbmc.log(f'[AIOStreams] DB Check Show {imdb_id}: {stats["watched_count"]}/{stats["total"]} episodes watched -> {is_watched}', xbmc.LOGDEBUG)
+            return is_watched
+            
+        elif mediatype == 'episode':
+            # Check specific episode
+            row = self.fetchone("SELECT watched FROM episodes WHERE imdb_id = ?", (imdb_id,))
+            is_watched = bool(row and row['watched'])
+            # xbmc.log(f'[AIOStreams] DB Check Episode {imdb_id}: {is_watched}', xbmc.LOGDEBUG)
+            return is_watched
+            
+        return False
+
+    # Bound parameters per IN (...) query or multi-row VALUES insert, well below
+    # SQLITE_MAX_VARIABLE_NUMBER on old builds (999)
+    IN_CHUNK_SIZE = 500
+
+    def are_imdb_watched(self, imdb_ids, mediatype):
+        """Batch form of is_imdb_watched for list rendering.
+
+        Args:
+            imdb_ids: Iterable of IMDB IDs
+            mediatype: 'movie', 'episode', or 'show'/'series'/'tvshow'
+
+        Returns:
+            dict: {imdb_id: bool} for every non-empty ID given
+        """
+        ids = list(dict.fromkeys(i for i in imdb_ids if i))
+        result = dict.fromkeys(ids, False)
+        if not ids:
+            return result
+
+        prefix = ()
+        if mediatype == 'movie':
+            sql = "SELECT imdb_id, watched FROM movies WHERE imdb_id IN ({})"
+        elif mediatype == 'episode':
+            sql = "SELECT imdb_id, watched FROM episodes WHERE imdb_id IN ({})"
+        elif mediatype in ['show', 'series', 'tvshow']:
+            # Same rule as is_imdb_watched: every aired episode watched
+            sql = """
+                SELECT
+                    s.imdb_id,
+                    SUM(CASE WHEN e.watched = 1 THEN 1 ELSE 0 END) >= COUNT(*) as watched
+                FROM shows s
+                INNER JOIN episodes e
+                    ON e.show_trakt_id = s.trakt_id
+                    AND e.air_date <= ?
+                WHERE s.imdb_id IN ({})
+                GROUP BY s.imdb_id
+            """
+            prefix = (utc_now_iso(),)
+        else:
+            return result
+
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return result
+
+            for start in range(0, len(ids), self.IN_CHUNK_SIZE):
+                chunk = ids[start:start + self.IN_CHUNK_SIZE]
+                cursor = self.execute(sql.format(','.join('?' * len(chunk))), prefix + tuple(chunk))
+                if cursor:
+                    for imdb_id, watched in cursor:
+                        if watched:
+                            result[imdb_id] = True
+            return result
+        except Exception as e:
+            xbmc.log(f'[AIOStreams] Error checking IMDb watched status: {e}', xbmc.LOGERROR)
+            return result
+
     def get_imdb_show_progress(self, imdb_id):
         """Get show progress (aired, completed) by IMDB ID directly from local DB."""
         if not imdb_id:
@@ -1141,25 +1954,10 @@ class TraktSyncDatabase(Database):
                 if not self.connect():
                     return None
 
-            # First get the show's Trakt ID
-            # Use safe wrapper that handles connection/disconnection
-            row = self.fetchone("SELECT trakt_id FROM shows WHERE imdb_id = ?", (imdb_id,))
-            if not row:
-                return None
-            
-            trakt_id = row['trakt_id']
-            
             # Count total and watched episodes (only aired ones)
-            stats = self.fetchone("""
-                SELECT 
-                    COUNT(*) as total,
-                    SUM(CASE WHEN watched = 1 THEN 1 ELSE 0 END) as watched_count
-                FROM episodes 
-                WHERE show_trakt_id = ? AND air_date <= datetime('now')
-            """, (trakt_id,))
-            
+            stats = self.fetchone(self.GET_IMDB_SHOW_PROGRESS_SQL, (utc_now_iso(), imdb_id))
             if not stats:
-                return {'aired': 0, 'completed': 0}
+                return None
                 
             return {
                 'aired': stats['total'],
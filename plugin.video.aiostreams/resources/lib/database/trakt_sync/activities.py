@@ -7,9 +7,10 @@ Based on Seren's activities sync implementation:
 https://github.com/nixgates/plugin.video.seren/blob/b4f4b63bf59b38b93bd565a8503e121f64c91e30/resources/lib/database/trakt_sync/activities.py
 """
 import time
+from contextlib import nullcontext
 import xbmc
 import xbmcgui
-from resources.lib.database.trakt_sync import TraktSyncDatabase as BaseTraktDB
+from resources.lib.database.trakt_sync import TraktSyncDatabase as BaseTraktDB, serialize, deserialize
 from resources.lib import trakt
 
 
@@ -122,29 +123,32 @@ class TraktSyncDatabase(BaseTraktDB):
             # Always sync hidden items
             sync_tasks.append(('Syncing hidden items...', self._sync_hidden_items))
             
-            # Execute sync tasks with progress updates
-            total_tasks = len(sync_tasks)
-            for index, (message, task_func) in enumerate(sync_tasks):
-                if self.progress_dialog:
-                    percent = int((index / total_tasks) * 100)
-                    self.progress_dialog.update(percent, message)
+            # The first sync loads the whole history: run it against an in-memory copy
+            sync_context = nullcontext() if local_activities else self.bulk_sync_context()
+            with sync_context:
+                # Execute sync tasks with progress updates
+                total_tasks = len(sync_tasks)
+                for index, (message, task_func) in enumerate(sync_tasks):
+                    if self.progress_dialog:
+                        percent = int((index / total_tasks) * 100)
+                        self.progress_dialog.update(percent, message)
                     
-                # Check if search is active (Global or Internal)
-                win_home = xbmcgui.Window(10000)
-                if win_home.getProperty('AIOStreams.SearchActive') == 'true' or \
-                   win_home.getProperty('AIOStreams.InternalSearchActive') == 'true':
-                    xbmc.log('[AIOStreams] Sync interrupted by active search', xbmc.LOGDEBUG)
-                    return False
-
-                try:
-                    task_func()
-                except Exception as e:
-                    error_msg = f'Error in {message}: {e}'
-                    xbmc.log(f'[AIOStreams] {error_msg}', xbmc.LOGERROR)
-                    self.sync_errors.append(error_msg)
-            
-            # Update local activities timestamps to match remote
-            self._update_local_activities(remote_activities)
+                    # Check if search is active (Global or Internal)
+                    win_home = xbmcgui.Window(10000)
+                    if win_home.getProperty('AIOStreams.SearchActive') == 'true' or \
+                       win_home.getProperty('AIOStreams.InternalSearchActive') == 'true':
+                        xbmc.log('[AIOStreams] Sync interrupted by active search', xbmc.LOGDEBUG)
+                        return False
+
+                    try:
+                        task_func()
+                    except Exception as e:
+                        error_msg = f'Error in {message}: {e}'
+                        xbmc.log(f'[AIOStreams] {error_msg}', xbmc.LOGERROR)
+                        self.sync_errors.append(error_msg)
+            
+                # Update local activities timestamps to match remote
+                self._update_local_activities(remote_activities)
             
             # Finalize
             self._finalize_sync(silent)
@@ -252,12 +256,11 @@ class TraktSyncDatabase(BaseTraktDB):
             if not trakt_id:
                 continue
             
-            import pickle
             batch_data.append((
                 trakt_id,
                 movie.get('ids', {}).get('imdb'),
                 movie.get('ids', {}).get('tmdb'),
-                pickle.dumps(movie),
+                serialize(movie),
                 item.get('watched_at')
             ))
             
@@ -289,12 +292,11 @@ class TraktSyncDatabase(BaseTraktDB):
             if not trakt_id:
                 continue
             
-            import pickle
             batch_data.append((
                 trakt_id,
                 movie.get('ids', {}).get('imdb'),
                 movie.get('ids', {}).get('tmdb'),
-                pickle.dumps(movie),
+                serialize(movie),
                 item.get('collected_at')
             ))
             
@@ -330,12 +332,11 @@ class TraktSyncDatabase(BaseTraktDB):
             if not trakt_id:
                 continue
             
-            import pickle
             batch_data.append((
                 trakt_id,
                 movie.get('ids', {}).get('imdb'),
                 item.get('listed_at'),
-                pickle.dumps(movie)
+                serialize(movie)
             ))
             
         # Execute batch update
@@ -423,7 +424,7 @@ class TraktSyncDatabase(BaseTraktDB):
                 show.get('ids', {}).get('tvdb'),
                 show.get('ids', {}).get('slug'),
                 show.get('title', 'Unknown'),
-                pickle.dumps(show)
+                serialize(show)
             ))
         
         if batch_shows:
@@ -431,8 +432,6 @@ class TraktSyncDatabase(BaseTraktDB):
                 INSERT OR IGNORE INTO shows (trakt_id, imdb_id, tmdb_id, tvdb_id, slug, title, metadata, last_updated)
                 VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
             """, batch_shows)
-            
-        import pickle
 
         # 2. Process episodes for each show
         for item in watched_shows:
@@ -453,7 +452,7 @@ class TraktSyncDatabase(BaseTraktDB):
             # 2a. Batch insert all episodes
             batch_episodes = []
             for ep in all_episodes:
-                pickled_metadata = pickle.dumps(ep.get('metadata', {}))
+                pickled_metadata = serialize(ep.get('metadata', {}))
                 
                 batch_episodes.append((
                     show_trakt_id,
@@ -568,12 +567,11 @@ class TraktSyncDatabase(BaseTraktDB):
             if not trakt_id:
                 continue
             
-            import pickle
             batch_data.append((
                 trakt_id,
                 show.get('ids', {}).get('imdb'),
                 item.get('listed_at'),
-                pickle.dumps(show)
+                serialize(show)
             ))
             
         if batch_data:
@@ -718,8 +716,7 @@ class TraktSyncDatabase(BaseTraktDB):
                 sql_meta = "SELECT metadata FROM shows WHERE trakt_id=?"
                 row_meta = self.fetchone(sql_meta, (show_id,))
                 if row_meta and row_meta['metadata']:
-                    import pickle
-                    meta = pickle.loads(row_meta['metadata'])
+                    meta = deserialize(row_meta['metadata'])
                     # Try multiple fields that might contain total episode count
                     # aired_episodes is the canonical count from Trakt
                     if 'aired_episodes' in meta and meta['aired_episodes'] > 0:
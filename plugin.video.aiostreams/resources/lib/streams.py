@@ -67,16 +67,14 @@ class StreamManager:
         Detect quality from stream name.
         Returns tuple: (quality_key, quality_rank, quality_label)
         """
-        name_lower = stream_name.lower()
-
-        # Check for quality indicators
-        for quality_key, rank in sorted(constants.QUALITY_RANKS.items(), key=lambda x: x[1], reverse=True):
-            if quality_key in name_lower:
-                label = constants.QUALITY_LABELS.get(quality_key, f'[{quality_key.upper()}]')
-                return quality_key, rank, label
+        # Check for quality indicators, keeping the best one if several appear
+        tokens = [match.lower() for match in constants.QUALITY_RE.findall(stream_name)]
+        if tokens:
+            quality_key = max(tokens, key=constants.QUALITY_RANKS.__getitem__)
+            return (quality_key,) + constants.QUALITY[quality_key]
 
         # Default to SD if no quality found
-        return 'sd', constants.QUALITY_RANKS['sd'], constants.QUALITY_LABELS['sd']
+        return ('sd',) + constants.QUALITY['sd']
 
     def get_quality_color(self, quality_rank):
         """Get color code based on quality rank."""
@@ -97,7 +95,7 @@ class StreamManager:
         if not filter_low:
             return streams
 
-        min_rank = constants.QUALITY_RANKS.get(min_quality, 0)
+        min_rank = constants.resolve_quality(min_quality)[0]
         filtered = []
 
         for stream in streams:
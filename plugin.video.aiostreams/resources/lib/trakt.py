@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Trakt.tv integration for AIOStreams"""
+import atexit
 import xbmc
 import xbmcgui
 import xbmcaddon
@@ -9,6 +10,8 @@ import time
 import json
 import random
 import threading
+import weakref
+from contextlib import contextmanager
 
 # Import cache module
 try:
@@ -24,9 +27,34 @@ ADDON = xbmcaddon.Addon()
 API_ENDPOINT = 'https://api.trakt.tv'
 API_VERSION = '2'
 
-# Database instance (thread-local to avoid SQLite concurrency issues)
+# Database instance (thread-local to avoid SQLite concurrency issues).
+# Each thread keeps its connection open for the life of the process instead of
+# reopening the file (and re-running the connection pragmas) on every lookup.
 _trakt_db = threading.local()
 
+# Open instances, closed together at interpreter exit. Weak references, so an
+# instance whose thread has ended can still be garbage-collected (and closed).
+_open_trakt_dbs = weakref.WeakSet()
+
+
+def _close_trakt_dbs():
+    """Close every Trakt database connection still open at interpreter exit."""
+    for db in list(_open_trakt_dbs):
+        db.disconnect()
+
+
+atexit.register(_close_trakt_dbs)
+
+# Row snapshots taken before optimistic watched/watchlist updates, for rollback.
+# Only the restored columns are selected (never the metadata BLOB), and the fixed
+# strings are reused from the connection's prepared statement cache.
+_EPISODE_STATE_SQL = (
+    "SELECT show_trakt_id, season, episode, watched, last_watched_at "
+    "FROM episodes WHERE show_trakt_id=? AND season=? AND episode=?"
+)
+_MOVIE_STATE_SQL = "SELECT trakt_id, imdb_id, watched, last_watched_at FROM movies WHERE trakt_id=?"
+_WATCHLIST_STATE_SQL = "SELECT trakt_id, mediatype, imdb_id, listed_at FROM watchlist WHERE imdb_id=? AND mediatype=?"
+
 
 def get_trakt_db():
     """Get or create Trakt sync database instance (thread-safe).
@@ -42,6 +70,7 @@ def get_trakt_db():
             from resources.lib.database.trakt_sync.activities import TraktSyncDatabase
             db = TraktSyncDatabase()
             db.connect()
+            _open_trakt_dbs.add(db)
             _trakt_db.connection = db
             xbmc.log(f'[AIOStreams] Trakt database initialized for thread {threading.get_ident()}', xbmc.LOGDEBUG)
         except Exception as e:
@@ -50,6 +79,34 @@ def get_trakt_db():
     
     return _trakt_db.connection
 
+
+def close_trakt_db():
+    """Close this thread's Trakt database connection.
+
+    Worker threads call this when they are done with the database; the next
+    get_trakt_db() call on the thread opens a fresh connection.
+    """
+    db = getattr(_trakt_db, 'connection', None)
+    if db is not None:
+        _trakt_db.connection = None
+        _open_trakt_dbs.discard(db)
+        db.disconnect()
+
+
+@contextmanager
+def row_cache_batch():
+    """Run a listing's local database lookups as one row cache batch.
+
+    See TraktSyncDatabase.row_cache_batch; without a database this does nothing.
+    """
+    db = get_trakt_db()
+    if db is None:
+        yield
+        return
+    with db.row_cache_batch():
+        yield
+
+
 # In-memory cache for batch show progress (invalidated on watched status changes)
 _show_progress_batch_cache = {}
 _show_progress_cache_valid = False
@@ -130,7 +187,7 @@ def get_all_show_progress():
     if db and db.connect():
         try:
             # Get all shows that have at least one watched episode
-            shows = db.fetchall("""
+            shows = db.iter_rows("""
                 SELECT DISTINCT s.*,
                     (SELECT MAX(e.last_watched_at) FROM episodes e WHERE e.show_trakt_id = s.trakt_id AND e.watched = 1) as last_watched_at
                 FROM shows s
@@ -147,7 +204,7 @@ def get_all_show_progress():
                 show_trakt_id = show.get('trakt_id')
 
                 # Get watched episodes for this show to build seasons data
-                episodes = db.fetchall("""
+                episodes = db.iter_rows("""
                     SELECT season, episode, watched, last_watched_at
                     FROM episodes
                     WHERE show_trakt_id = ? AND watched = 1
@@ -193,8 +250,6 @@ def get_all_show_progress():
 
         except Exception as e:
             xbmc.log(f'[AIOStreams] Database error getting all show progress: {e}', xbmc.LOGWARNING)
-        finally:
-            db.disconnect()
 
     # Fallback to API
     xbmc.log('[AIOStreams] Database unavailable, fetching all show progress from API', xbmc.LOGDEBUG)
@@ -1370,7 +1425,7 @@ def remove_from_watchlist(media_type, imdb_id, season=None, episode=None):
     if db:
         try:
             original_state = db.fetchone(
-                "SELECT * FROM watchlist WHERE imdb_id=? AND mediatype=?",
+                _WATCHLIST_STATE_SQL,
                 (imdb_id, mediatype_db)
             )
         except Exception as e:
@@ -1587,7 +1642,7 @@ def mark_watched(media_type, imdb_id, season=None, episode=None, playback_id=Non
 
                 # Store original state
                 original_states.append(db.fetchone(
-                    "SELECT * FROM episodes WHERE show_trakt_id=? AND season=? AND episode=?",
+                    _EPISODE_STATE_SQL,
                     (show_trakt_id, season, episode)
                 ))
 
@@ -1620,7 +1675,7 @@ def mark_watched(media_type, imdb_id, season=None, episode=None, playback_id=Non
                         if ep_num:
                             # Store original state
                             original_states.append(db.fetchone(
-                                "SELECT * FROM episodes WHERE show_trakt_id=? AND season=? AND episode=?",
+                                _EPISODE_STATE_SQL,
                                 (show_trakt_id, season, ep_num)
                             ))
 
@@ -1662,7 +1717,7 @@ def mark_watched(media_type, imdb_id, season=None, episode=None, playback_id=Non
                             if ep_num:
                                 # Store original state
                                 original_states.append(db.fetchone(
-                                    "SELECT * FROM episodes WHERE show_trakt_id=? AND season=? AND episode=?",
+                                    _EPISODE_STATE_SQL,
                                     (show_trakt_id, season_num, ep_num)
                                 ))
 
@@ -1687,7 +1742,7 @@ def mark_watched(media_type, imdb_id, season=None, episode=None, playback_id=Non
 
                 # Store original state
                 original_states.append(db.fetchone(
-                    "SELECT * FROM movies WHERE trakt_id=?",
+                    _MOVIE_STATE_SQL,
                     (trakt_id,)
                 ))
 
@@ -1970,7 +2025,7 @@ def mark_unwatched(media_type, imdb_id, season=None, episode=None):
 
                 # Store original state
                 original_states.append(db.fetchone(
-                    "SELECT * FROM episodes WHERE show_trakt_id=? AND season=? AND episode=?",
+                    _EPISODE_STATE_SQL,
                     (show_trakt_id, season, episode)
                 ))
 
@@ -2000,7 +2055,7 @@ def mark_unwatched(media_type, imdb_id, season=None, episode=None):
                         if ep_num:
                             # Store original state
                             original_states.append(db.fetchone(
-                                "SELECT * FROM episodes WHERE show_trakt_id=? AND season=? AND episode=?",
+                                _EPISODE_STATE_SQL,
                                 (show_trakt_id, season, ep_num)
                             ))
 
@@ -2039,7 +2094,7 @@ def mark_unwatched(media_type, imdb_id, season=None, episode=None):
                             if ep_num:
                                 # Store original state
                                 original_states.append(db.fetchone(
-                                    "SELECT * FROM episodes WHERE show_trakt_id=? AND season=? AND episode=?",
+                                    _EPISODE_STATE_SQL,
                                     (show_trakt_id, season_num, ep_num)
                                 ))
 
@@ -2061,7 +2116,7 @@ def mark_unwatched(media_type, imdb_id, season=None, episode=None):
 
                 # Store original state
                 original_states.append(db.fetchone(
-                    "SELECT * FROM movies WHERE trakt_id=?",
+                    _MOVIE_STATE_SQL,
                     (trakt_id,)
                 ))
 
@@ -2302,8 +2357,6 @@ def is_in_watchlist(media_type, imdb_id):
             return result is not None
         except Exception as e:
             xbmc.log(f'[AIOStreams] Database error checking watchlist: {e}', xbmc.LOGWARNING)
-        finally:
-            db.disconnect()
     
     # Fallback to API cache
     api_type = 'movies' if media_type == 'movie' else 'shows'
@@ -2368,19 +2421,22 @@ def prime_database_cache(media_type):
         
     try:
         if media_type == 'movie':
-            rows = db.fetch_all("SELECT imdb_id FROM movies WHERE watched=1")
-            _watched_id_db_cache['movie'] = {row['imdb_id']: True for row in rows if row['imdb_id']}
+            columns = db.fetchall(
+                "SELECT imdb_id FROM movies WHERE watched=1 AND imdb_id IS NOT NULL AND imdb_id != ''",
+                columnar=True
+            )
+            _watched_id_db_cache['movie'] = dict.fromkeys(columns.get('imdb_id', ()), True)
         else:
             # For shows, we cache both the basic 'is any episode watched' and the full progress
             # Optimization: Use a single JOIN query instead of iterating all shows
-            rows = db.fetch_all("""
+            columns = db.fetchall("""
                 SELECT DISTINCT s.imdb_id 
                 FROM shows s 
                 JOIN episodes e ON s.trakt_id = e.show_trakt_id 
                 WHERE e.watched = 1 AND s.imdb_id IS NOT NULL AND s.imdb_id != ''
-            """)
+            """, columnar=True)
             
-            watched_shows = {row['imdb_id']: True for row in rows}
+            watched_shows = dict.fromkeys(columns.get('imdb_id', ()), True)
             
             _watched_id_db_cache['series'] = watched_shows
             _watched_id_db_cache['show'] = watched_shows
@@ -2389,8 +2445,6 @@ def prime_database_cache(media_type):
         xbmc.log(f'[AIOStreams] Primed {media_type} database cache ({len(_watched_id_db_cache.get(media_type, {}))} items)', xbmc.LOGDEBUG)
     except Exception as e:
         xbmc.log(f'[AIOStreams] Failed to prime database cache: {e}', xbmc.LOGWARNING)
-    finally:
-        db.disconnect()
 
 
 def is_watched(media_type, imdb_id):
@@ -2440,8 +2494,6 @@ def is_watched(media_type, imdb_id):
             return False
         except Exception as e:
             xbmc.log(f'[AIOStreams] Database error checking watched status: {e}', xbmc.LOGWARNING)
-        finally:
-            db.disconnect()
     
     # Fallback to API cache
     api_type = 'movies' if media_type == 'movie' else 'shows'
@@ -2472,7 +2524,7 @@ def get_show_progress(imdb_id):
                 show_trakt_id = show.get('trakt_id')
 
                 # Get all episodes for this show
-                episodes = db.fetchall(
+                episodes = db.iter_rows(
                     "SELECT season, episode, watched FROM episodes WHERE show_trakt_id=? ORDER BY season, episode",
                     (show_trakt_id,)
                 )
@@ -2533,8 +2585,6 @@ def get_show_progress(imdb_id):
                     return progress
         except Exception as e:
             xbmc.log(f'[AIOStreams] Database error getting show progress: {e}', xbmc.LOGWARNING)
-        finally:
-            db.disconnect()
 
     # Fallback: Try Trakt API if database is empty or unavailable
     xbmc.log(f'[AIOStreams] Database empty, fetching from Trakt API for {imdb_id}', xbmc.LOGDEBUG)
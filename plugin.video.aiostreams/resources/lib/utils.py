@@ -7,6 +7,21 @@ import xbmc
 import threading
 import time
 
+# Whether Kodi debug logging is on, resolved once per process
+_debug_logging = None
+
+
+def debug_logging_enabled():
+    """Return True if Kodi is writing LOGDEBUG messages to the log.
+
+    Hot paths check this before building debug f-strings, which would
+    otherwise be formatted and then discarded when debug logging is off.
+    """
+    global _debug_logging
+    if _debug_logging is None:
+        _debug_logging = bool(xbmc.getCondVisibility('System.GetBool(debug.showloginfo)'))
+    return _debug_logging
+
 
 def wait_for_home_window(timeout=10):
     """Wait for Kodi home window to be active before proceeding.